@@ -1,8 +1,9 @@
 # SEAA Connectors
 # External service integrations
 
-from seaa.connectors.llm_gateway import ProviderGateway
+from seaa.connectors.llm_gateway import ProviderGateway, get_gateway
 
 __all__ = [
     "ProviderGateway",
+    "get_gateway",
 ]
@@ -12,13 +12,23 @@ Features:
 """
 
 import ast
+import asyncio
+import atexit
+import collections
+import functools
+import hashlib
 import inspect
 import os
+import random
 import re
+import sqlite3
+import threading
 import time
 import requests
+from requests.adapters import HTTPAdapter
 import json
-from typing import Any, Optional, Union, List, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Optional, Union, List, Tuple
 
 from seaa.core.logging import get_logger
 from seaa.core.config import config
@@ -31,6 +41,30 @@ from seaa.cortex.prompt_loader import prompt_loader
 
 logger = get_logger("gateway")
 
+# Compiled once: matches a module-level start() definition
+_START_RE = re.compile(r'def\s+start\s*\([^)]*\)\s*:')
+
+# Extracts fenced code block bodies (```python ... ```) in one C-level pass
+_CODE_FENCE_RE = re.compile(r"```(?:[a-zA-Z]+)?\n?(.*?)```", re.DOTALL)
+
+
+@functools.lru_cache(maxsize=32)
+def _render_feedback(safe_error_message: str, instruction: str) -> str:
+    """
+    Render the error-feedback block appended to retry prompts.
+
+    Retries for the same validation failure re-render identical
+    feedback, so the result is memoized on (error, instruction).
+    """
+    try:
+        return prompt_loader.render(
+            "error_feedback",
+            error_message=safe_error_message,
+            additional_instruction=instruction,
+        )
+    except FileNotFoundError:
+        return f"\n\nCRITICAL ERROR: {safe_error_message}\n{instruction}"
+
 # Forbidden imports that could compromise system security
 FORBIDDEN_IMPORTS = frozenset([
     # Package installation
@@ -89,6 +123,218 @@ FORBIDDEN_IMPORTS = frozenset([
 ])
 
 
+class LLMCache:
+    """
+    Persistent response cache for deterministic LLM calls.
+
+    Keyed by SHA256(provider|model|temperature|prompt) and backed by
+    sqlite3 so hits survive restarts. Only near-deterministic prompts
+    (temperature <= 0.1) should be cached - at higher temperatures the
+    same prompt is expected to produce different output.
+
+    Besides exact matches, fuzzy_lookup() can recover hits for prompts
+    that differ only cosmetically (a timestamp, whitespace, a reworded
+    docstring) via Jaccard similarity on normalized token sets. Callers
+    opt in explicitly (think(fuzzy_cache=True)); it is never applied to
+    generated code, where template-dominated prompts make near-identical
+    token sets for unrelated organs.
+    """
+
+    # Entries older than this are treated as misses
+    DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+
+    # Minimum token-set similarity for a fuzzy hit
+    SIMILARITY_THRESHOLD = 0.85
+
+    # Only the most recent entries are scanned on a fuzzy lookup
+    FUZZY_CANDIDATES = 64
+
+    # Hot entries served from process memory without touching sqlite
+    MEM_CACHE_SIZE = 256
+
+    _PUNCT_TABLE = str.maketrans({c: " " for c in "!\"#$%&'()*+,-./:;<=>?@[\\]^`{|}~"})
+
+    def __init__(self, db_path: Union[str, "os.PathLike"], ttl_seconds: int = DEFAULT_TTL_SECONDS):
+        self._ttl = ttl_seconds
+        self._lock = threading.Lock()
+        # Session counters for introspection (exposed via stats())
+        self._hits = 0
+        self._misses = 0
+        # Bounded LRU in front of sqlite - repeated prompts within a
+        # run are served without a query or row decode
+        self._mem: "collections.OrderedDict[str, str]" = collections.OrderedDict()
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        # WAL keeps concurrent reader threads off the writer's lock
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, response TEXT NOT NULL, ts INTEGER NOT NULL, "
+            "provider TEXT DEFAULT '', model TEXT DEFAULT '', temp REAL DEFAULT 0, "
+            "tokens TEXT DEFAULT '')"
+        )
+        # Migrate caches created before the fuzzy-lookup columns existed
+        existing = {row[1] for row in self._conn.execute("PRAGMA table_info(responses)")}
+        for column, decl in (
+            ("provider", "TEXT DEFAULT ''"),
+            ("model", "TEXT DEFAULT ''"),
+            ("temp", "REAL DEFAULT 0"),
+            ("tokens", "TEXT DEFAULT ''"),
+        ):
+            if column not in existing:
+                self._conn.execute(f"ALTER TABLE responses ADD COLUMN {column} {decl}")
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(provider: str, model: str, temperature: float, prompt: str) -> str:
+        return hashlib.sha256(
+            f"{provider}|{model}|{temperature}|{prompt}".encode("utf-8")
+        ).hexdigest()
+
+    @classmethod
+    def _tokenize(cls, prompt: str) -> frozenset:
+        """Normalize a prompt to a token set: lowercase, no punctuation."""
+        return frozenset(prompt.lower().translate(cls._PUNCT_TABLE).split())
+
+    def _mem_put(self, key: str, response: str) -> None:
+        self._mem[key] = response
+        self._mem.move_to_end(key)
+        if len(self._mem) > self.MEM_CACHE_SIZE:
+            self._mem.popitem(last=False)
+
+    def lookup(self, key: str) -> Optional[str]:
+        """Return the cached response, or None on miss/expiry."""
+        with self._lock:
+            hot = self._mem.get(key)
+            if hot is not None:
+                self._mem.move_to_end(key)
+                self._hits += 1
+                return hot
+            row = self._conn.execute(
+                "SELECT response, ts FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            self._misses += 1
+            return None
+        response, ts = row
+        if time.time() - ts > self._ttl:
+            with self._lock:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+            self._misses += 1
+            return None
+        with self._lock:
+            self._mem_put(key, response)
+        self._hits += 1
+        return response
+
+    def fuzzy_lookup(
+        self,
+        provider: str,
+        model: str,
+        temperature: float,
+        prompt: str,
+    ) -> Optional[str]:
+        """
+        Find a near-identical cached prompt for the same provider config.
+
+        Scans the most recent candidates and returns the response whose
+        normalized token set has Jaccard similarity >= the threshold.
+        """
+        query_tokens = self._tokenize(prompt)
+        if not query_tokens:
+            return None
+
+        cutoff = int(time.time()) - self._ttl
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT response, tokens FROM responses "
+                "WHERE provider = ? AND model = ? AND temp = ? AND ts > ? "
+                "ORDER BY ts DESC LIMIT ?",
+                (provider, model, temperature, cutoff, self.FUZZY_CANDIDATES),
+            ).fetchall()
+
+        best_response = None
+        best_score = self.SIMILARITY_THRESHOLD
+        for response, tokens in rows:
+            candidate = frozenset(tokens.split())
+            if not candidate:
+                continue
+            score = len(query_tokens & candidate) / len(query_tokens | candidate)
+            if score >= best_score:
+                best_score = score
+                best_response = response
+        if best_response is not None:
+            self._hits += 1
+        else:
+            self._misses += 1
+        return best_response
+
+    def stats(self) -> Dict[str, int]:
+        """Session hit/miss counters (not persisted)."""
+        return {"hits": self._hits, "misses": self._misses}
+
+    def delete(self, key: str) -> None:
+        """Evict an entry (e.g. a response that failed validation)."""
+        with self._lock:
+            self._mem.pop(key, None)
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._conn.commit()
+
+    def store(
+        self,
+        key: str,
+        response: str,
+        provider: str = "",
+        model: str = "",
+        temperature: float = 0.0,
+        prompt: str = "",
+    ) -> None:
+        tokens = " ".join(sorted(self._tokenize(prompt))) if prompt else ""
+        with self._lock:
+            self._mem_put(key, response)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, response, ts, provider, model, temp, tokens) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, response, int(time.time()), provider, model, temperature, tokens),
+            )
+            self._conn.commit()
+
+
+class RateLimiter:
+    """
+    Token-bucket limiter for provider calls.
+
+    Keeps burst generation under the provider's queries-per-minute cap
+    so we never trip a 429 and burn the retry budget on rate-limit
+    errors. acquire() blocks until a token is available; a limit of 0
+    disables limiting entirely.
+    """
+
+    def __init__(self, per_minute: int):
+        self._enabled = per_minute > 0
+        self._capacity = float(max(per_minute, 1))
+        self._tokens = self._capacity
+        self._rate = per_minute / 60.0  # tokens per second
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a call slot is available."""
+        if not self._enabled:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self._capacity, self._tokens + (now - self._last) * self._rate)
+                self._last = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                wait = (1.0 - self._tokens) / self._rate
+            time.sleep(wait)
+
+
 class ProviderGateway:
     """
     The Voice of the System.
@@ -103,23 +349,86 @@ class ProviderGateway:
         self.temperature = config.llm.temperature
         self.max_retries = config.llm.max_retries
         self.timeout = config.llm.timeout_seconds
+        # (connect, read) tuple: a down provider fails after the short
+        # connect timeout instead of hanging for the full read window
+        self._timeouts = (config.llm.connect_timeout_seconds, config.llm.timeout_seconds)
+        self.max_output_tokens = config.llm.max_output_tokens
         
         # Ollama config
         self.ollama_url = config.llm.ollama_url
+        # After a ConnectionError, skip Ollama entirely until this
+        # monotonic deadline instead of re-paying the connect timeout
+        # on every call
+        self._ollama_down_until: float = 0.0
         
         # Gemini config
         self.gemini_key = os.environ.get("GEMINI_API_KEY")
         self.gemini_model = config.llm.gemini_model
-        
+        # Model and key never change after construction - build the
+        # endpoint URL once instead of per call
+        self._gemini_url = (
+            f"https://generativelanguage.googleapis.com/v1beta/models/"
+            f"{self.gemini_model}:generateContent?key={self.gemini_key}"
+        ) if self.gemini_key else None
+
+        # Persistent session: keep-alive sockets mean repeated Gemini
+        # calls skip the TCP + TLS handshake that a bare requests.post
+        # pays on every request
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._session.headers.update({"Content-Type": "application/json"})
+
+        # Response cache for near-deterministic prompts (retries and
+        # reflection loops often resend identical prompts)
+        try:
+            self._cache: Optional[LLMCache] = LLMCache(config.paths.root / ".llm_cache.db")
+        except Exception as e:
+            logger.warning(f"LLM cache unavailable: {e}")
+            self._cache = None
+
+        # Client-side pacing so bursts never trip provider rate limits
+        self._gemini_rl = RateLimiter(config.llm.gemini_qpm)
+        self._ollama_rl = RateLimiter(config.llm.ollama_qpm)
+
+        # Background pool: callers that can't afford to block on a
+        # multi-second LLM round-trip submit work here instead
+        self._pool = ThreadPoolExecutor(
+            max_workers=config.llm.concurrency,
+            thread_name_prefix="llm",
+        )
+        atexit.register(self._pool.shutdown, wait=False)
+
         logger.info(f"Gateway initialized: provider={self.provider}, model={self.model}")
     
-    def think(self, prompt: str) -> Optional[str]:
+    def think(
+        self,
+        prompt: str,
+        stop: Optional[List[str]] = None,
+        temperature: float = 0.5,
+        fuzzy_cache: bool = False,
+    ) -> Optional[str]:
         """
         Generate a thought (non-code response).
-        
-        Used for Architect reflection.
+
+        Used for Architect reflection. Optional stop sequences halt
+        decoding server-side as soon as one is emitted - the cheapest
+        way to avoid paying for tokens the caller would discard.
+
+        fuzzy_cache opts a near-deterministic call (temperature <= 0.1)
+        into similarity-matched cache hits: prompts that differ only
+        cosmetically (a timestamp, whitespace) reuse the cached answer.
+        Never enabled by default - only the caller knows whether its
+        prompts are safe to conflate.
         """
-        return self._generate(prompt, validate_code=False, temperature=0.5)
+        return self._generate(
+            prompt,
+            validate_code=False,
+            temperature=temperature,
+            stop=stop,
+            fuzzy=fuzzy_cache,
+        )
     
     def generate_code(
         self,
@@ -155,11 +464,78 @@ class ProviderGateway:
             max_retries=self.max_retries,
         )
     
+    def think_future(self, prompt: str) -> "Future[Optional[str]]":
+        """
+        Non-blocking variant of think().
+
+        Runs the call on the gateway's worker pool so the calling thread
+        (often a bus callback) keeps dispatching during the LLM wait.
+        """
+        return self._pool.submit(self.think, prompt)
+
+    def generate_code_future(
+        self,
+        module_name: str,
+        description: str,
+        active_modules: Optional[List[str]] = None,
+    ) -> "Future[Optional[str]]":
+        """Non-blocking variant of generate_code()."""
+        return self._pool.submit(self.generate_code, module_name, description, active_modules)
+
+    async def athink(self, prompt: str) -> Optional[str]:
+        """
+        Awaitable variant of think() for asyncio callers.
+
+        The call still runs on the gateway's worker pool (which bounds
+        provider concurrency), so an event loop can overlap the LLM
+        round-trip with other work via asyncio.gather.
+        """
+        return await asyncio.wrap_future(self.think_future(prompt))
+
+    async def agenerate_code(
+        self,
+        module_name: str,
+        description: str,
+        active_modules: Optional[List[str]] = None,
+    ) -> Optional[str]:
+        """Awaitable variant of generate_code()."""
+        return await asyncio.wrap_future(
+            self.generate_code_future(module_name, description, active_modules)
+        )
+
+    def generate_code_batch(
+        self,
+        specs: List[Tuple[str, str]],
+        active_modules: Optional[List[str]] = None,
+    ) -> List[Optional[str]]:
+        """
+        Generate code for several organs concurrently.
+
+        Each spec is (module_name, description). Independent generations
+        overlap their LLM round-trips instead of serializing, so K organs
+        cost roughly one latency instead of K. Results are returned in
+        spec order; a failed generation yields None in its slot.
+        """
+        if not specs:
+            return []
+        if len(specs) == 1:
+            name, desc = specs[0]
+            return [self.generate_code(name, desc, active_modules)]
+
+        # The shared pool bounds concurrency (config.llm.concurrency)
+        futures = [
+            self._pool.submit(self.generate_code, name, desc, active_modules)
+            for name, desc in specs
+        ]
+        return [f.result() for f in futures]
+
     def _generate(
         self,
         prompt: str,
         validate_code: bool = False,
         temperature: Optional[float] = None,
+        stop: Optional[List[str]] = None,
+        fuzzy: bool = False,
     ) -> Optional[str]:
         """
         Core generation method.
@@ -167,17 +543,41 @@ class ProviderGateway:
         Tries Ollama first, falls back to Gemini.
         """
         temp = temperature if temperature is not None else self.temperature
-        
+
+        # Cache only near-deterministic calls - at higher temperatures
+        # the same prompt is supposed to vary
+        cache_key = None
+        if self._cache is not None and temp <= 0.1:
+            cache_key = LLMCache.make_key(self.provider, self.model, temp, prompt)
+            hit = self._cache.lookup(cache_key)
+            if hit is None and fuzzy and not validate_code:
+                # Exact miss: the caller opted into similarity matching
+                # for prompts that differ only cosmetically. Never for
+                # code generation: organ prompts are dominated by the
+                # shared agent_factory template, so two unrelated organs
+                # sit well above the similarity threshold and one
+                # organ's code would be materialized under the other's
+                # module name
+                hit = self._cache.fuzzy_lookup(self.provider, self.model, temp, prompt)
+            if hit is not None:
+                logger.debug("LLM cache hit - skipping provider call")
+                return hit
+
         # Try Ollama
         if self.provider == "ollama" or not self.gemini_key:
-            result = self._call_ollama(prompt, temp)
+            result = self._call_ollama(prompt, temp, stop)
             if result:
+                if cache_key is not None:
+                    self._cache.store(cache_key, result, self.provider, self.model, temp, prompt)
                 return result
-        
+
         # Fallback to Gemini
         if self.gemini_key:
-            return self._call_gemini(prompt)
-        
+            result = self._call_gemini(prompt, stop)
+            if result and cache_key is not None:
+                self._cache.store(cache_key, result, self.provider, self.model, temp, prompt)
+            return result
+
         logger.error("No LLM provider available")
         return None
     
@@ -205,6 +605,12 @@ class ProviderGateway:
 
             if not response:
                 logger.warning(f"No response on attempt {attempt + 1}")
+                # Transport failure: back off with jitter instead of
+                # re-hammering a rate-limited or struggling provider.
+                # Validation failures below retry immediately - the
+                # provider answered fine, the output was just wrong.
+                if attempt + 1 < max_retries:
+                    time.sleep(min(30.0, 0.5 * (2 ** attempt) + random.random() * 0.5))
                 continue
 
             # Clean the code
@@ -217,19 +623,20 @@ class ProviderGateway:
                 logger.warning(f"Validation FAILED: {error_message}")
                 last_error = error_message
 
+                # _generate cached the raw response on the way out;
+                # evict it, or attempt 1 of every later generation for
+                # this organ deterministically replays the same bad code
+                self._evict_cached(current_prompt)
+
                 # SECURITY: Sanitize error message before embedding in prompt
                 safe_error_message = self._sanitize_for_prompt(error_message)
 
-                # Build detailed error feedback
-                try:
-                    feedback = prompt_loader.render(
-                        "error_feedback",
-                        error_message=safe_error_message,
-                        additional_instruction=self._get_fix_instruction(error_message),
-                    )
-                except FileNotFoundError:
-                    feedback = f"\n\nCRITICAL ERROR: {safe_error_message}\n{self._get_fix_instruction(error_message)}"
-
+                # Cached render; rebuilt from the immutable base prompt
+                # so retries never accumulate stale feedback
+                feedback = _render_feedback(
+                    safe_error_message,
+                    self._get_fix_instruction(error_message),
+                )
                 current_prompt = prompt + feedback
                 continue
 
@@ -239,6 +646,13 @@ class ProviderGateway:
         logger.error(f"Failed to generate valid code after {max_retries} attempts. Last error: {last_error}")
         return None
 
+    def _evict_cached(self, prompt: str) -> None:
+        """Drop the cached entry for a prompt whose response failed validation."""
+        if self._cache is not None and self.temperature <= 0.1:
+            self._cache.delete(
+                LLMCache.make_key(self.provider, self.model, self.temperature, prompt)
+            )
+
     def _sanitize_for_prompt(self, text: str) -> str:
         """
         SECURITY: Sanitize text before embedding in LLM prompts.
@@ -406,57 +820,103 @@ class ProviderGateway:
     def _validate_start_function(self, code: str) -> bool:
         """Check if code contains a valid start() function (legacy method)."""
         # Match: def start(): or def start(anything):
-        pattern = r'def\s+start\s*\([^)]*\)\s*:'
-        return bool(re.search(pattern, code))
+        return _START_RE.search(code) is not None
     
     def _clean_code(self, text: str) -> str:
         """
         Clean LLM output to extract pure Python code.
-        
+
         Removes markdown code blocks and extra text.
         """
-        # Remove markdown code blocks
-        if "```" in text:
-            lines = []
-            in_block = False
-            for line in text.split("\n"):
-                stripped = line.strip()
-                if stripped.startswith("```"):
-                    in_block = not in_block
-                    continue
-                if in_block or (not in_block and not stripped.startswith("```")):
-                    # Only add lines that are inside a code block
-                    # or if there are no code blocks
-                    if in_block:
-                        lines.append(line)
-            
-            if lines:
-                text = "\n".join(lines)
-        
+        # Happy path: prompts forbid markdown, so most responses have no
+        # fences - skip the regex entirely
+        if "```" not in text:
+            return text.strip()
+
+        # One regex pass in C instead of iterating every line in
+        # Python; keeps only the fenced block bodies
+        matches = _CODE_FENCE_RE.findall(text)
+        if matches:
+            text = "\n".join(matches)
+
         return text.strip()
     
-    def _call_ollama(self, prompt: str, temperature: float) -> Optional[str]:
-        """Call Ollama API."""
+    def _call_ollama(
+        self,
+        prompt: str,
+        temperature: float,
+        stop: Optional[List[str]] = None,
+    ) -> Optional[str]:
+        """
+        Call Ollama API, streaming the response.
+
+        Streaming avoids the server buffering the whole generation
+        before replying, and lets us abort as soon as the output looks
+        complete (closing code fence after a start() definition) instead
+        of paying for trailing prose tokens.
+        """
+        if time.monotonic() < self._ollama_down_until:
+            logger.debug("Ollama marked down - skipping probe")
+            return None
+
         data = {
             "model": self.model,
             "prompt": prompt,
-            "stream": False,
-            "options": {"temperature": temperature},
+            "stream": True,
+            "options": {
+                "temperature": temperature,
+                # Bound the generation so latency and memory stay predictable
+                "num_predict": self.max_output_tokens,
+            },
         }
-        
+        if stop:
+            data["options"]["stop"] = stop
+
         try:
+            self._ollama_rl.acquire()
             logger.debug(f"Calling Ollama ({self.model})...")
-            response = requests.post(
+            with self._session.post(
                 self.ollama_url,
                 json=data,
-                timeout=self.timeout,
-            )
-            response.raise_for_status()
-            result = response.json()
-            return result.get("response")
-            
+                timeout=self._timeouts,
+                stream=True,
+            ) as response:
+                response.raise_for_status()
+
+                chunks: List[str] = []
+                tail = ""  # rolling window so markers split across chunks still match
+                fence_count = 0
+                seen_start = False
+
+                for line in response.iter_lines(decode_unicode=True):
+                    if not line:
+                        continue
+                    try:
+                        payload = json.loads(line)
+                    except ValueError:
+                        continue
+
+                    piece = payload.get("response")
+                    if piece:
+                        chunks.append(piece)
+                        tail = (tail + piece)[-64:]
+                        fence_count += piece.count("```")
+                        if not seen_start and "def start" in tail:
+                            seen_start = True
+                        # Fence closed after the entry point: the code is
+                        # complete, stop consuming (and generating) tokens
+                        if seen_start and fence_count >= 2:
+                            break
+
+                    if payload.get("done"):
+                        break
+
+                self._ollama_down_until = 0.0
+                return "".join(chunks) or None
+
         except requests.exceptions.ConnectionError:
             logger.warning("Ollama not reachable - is it running?")
+            self._ollama_down_until = time.monotonic() + 30.0
             return None
         except requests.exceptions.Timeout:
             logger.warning(f"Ollama timeout ({self.timeout}s)")
@@ -465,28 +925,54 @@ class ProviderGateway:
             logger.error(f"Ollama error: {e}")
             return None
     
-    def _call_gemini(self, prompt: str) -> Optional[str]:
+    def _call_gemini(self, prompt: str, stop: Optional[List[str]] = None) -> Optional[str]:
         """Call Gemini API."""
-        url = f"https://generativelanguage.googleapis.com/v1beta/models/{self.gemini_model}:generateContent?key={self.gemini_key}"
-        
         data = {
-            "contents": [{"parts": [{"text": prompt}]}]
+            "contents": [{"parts": [{"text": prompt}]}],
+            "generationConfig": {"maxOutputTokens": self.max_output_tokens},
         }
-        
+        if stop:
+            data["generationConfig"]["stopSequences"] = stop
+
         try:
+            self._gemini_rl.acquire()
             logger.debug(f"Calling Gemini ({self.gemini_model})...")
-            response = requests.post(
-                url,
-                headers={"Content-Type": "application/json"},
+            # URL precomputed in __init__; Content-Type set on the session
+            response = self._session.post(
+                self._gemini_url,
                 json=data,
-                timeout=self.timeout,
+                timeout=self._timeouts,
             )
+
+            # Honor the provider's own pacing on rate limits so the
+            # retry loop doesn't burn attempts inside the limit window
+            if response.status_code == 429:
+                retry_after = response.headers.get("Retry-After")
+                if retry_after:
+                    try:
+                        time.sleep(min(30.0, float(retry_after)))
+                    except ValueError:
+                        pass
+                logger.warning("Gemini rate-limited (429)")
+                return None
+
             response.raise_for_status()
             result = response.json()
-            
-            # Extract text from nested structure
-            return result["candidates"][0]["content"]["parts"][0]["text"]
-            
+
+            # Walk the nested structure with .get() so a safety-blocked
+            # or empty response logs its feedback instead of surfacing
+            # as an opaque KeyError
+            candidates = result.get("candidates") or []
+            if not candidates:
+                logger.warning(
+                    f"Gemini returned no candidates (likely safety block): "
+                    f"{result.get('promptFeedback')}"
+                )
+                return None
+
+            parts = candidates[0].get("content", {}).get("parts") or []
+            return parts[0].get("text") if parts else None
+
         except Exception as e:
             logger.error(f"Gemini error: {e}")
             return None
@@ -504,3 +990,21 @@ class ProviderGateway:
         
         CODE:
         """
+
+
+# Convenience: Module-level singleton.
+# One gateway per process means the connection pool and response cache
+# are shared by every caller instead of being rebuilt (and re-warmed)
+# per construction.
+_gateway: Optional[ProviderGateway] = None
+_gateway_lock = threading.Lock()
+
+
+def get_gateway() -> ProviderGateway:
+    """Get or create the process-wide gateway (thread-safe)."""
+    global _gateway
+    if _gateway is None:
+        with _gateway_lock:
+            if _gateway is None:  # Double-check locking
+                _gateway = ProviderGateway()
+    return _gateway
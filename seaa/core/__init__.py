@@ -2,12 +2,13 @@
 # Shared utilities, configuration, and logging
 
 from seaa.core.logging import get_logger
-from seaa.core.config import config
+from seaa.core.config import config, get_config
 from seaa.core.exceptions import SEAAError, DNAError, AssimilationError, EvolutionError
 
 __all__ = [
     "get_logger",
     "config",
+    "get_config",
     "SEAAError",
     "DNAError",
     "AssimilationError",
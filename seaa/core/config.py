@@ -9,19 +9,27 @@ Centralized configuration with:
 """
 
 import os
+import pickle
 from pathlib import Path
 from typing import Any, Dict, Optional, Union, List
 from dataclasses import dataclass, field
 
-# Try to import yaml, fall back to basic dict if not available
+# Try to import yaml, fall back to basic dict if not available.
+# Prefer the LibYAML loader - same safety as SafeLoader, ~10x faster,
+# and this parse runs at import time.
 try:
     import yaml
+    try:
+        from yaml import CSafeLoader as _YamlLoader
+    except ImportError:
+        from yaml import SafeLoader as _YamlLoader
     HAS_YAML = True
 except ImportError:
     HAS_YAML = False
+    _YamlLoader = None
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMConfig:
     """LLM provider configuration."""
     provider: str = "ollama"
@@ -29,7 +37,19 @@ class LLMConfig:
     temperature: float = 0.1
     max_retries: int = 3
     timeout_seconds: int = 120
-    
+    # Separate connect timeout: a down provider fails in seconds instead
+    # of hanging for the full read timeout
+    connect_timeout_seconds: float = 5.0
+    # Output token budget - unbounded generations have unpredictable
+    # latency and memory
+    max_output_tokens: int = 1024
+    # Worker threads for the gateway's background call pool
+    concurrency: int = 4
+    # Client-side queries-per-minute caps (0 disables the limiter).
+    # Staying under the provider's cap avoids 429s and wasted retries.
+    gemini_qpm: int = 60
+    ollama_qpm: int = 0
+
     # Ollama specific
     ollama_url: str = "http://localhost:11434/api/generate"
     
@@ -37,7 +57,7 @@ class LLMConfig:
     gemini_model: str = "gemini-1.5-flash"
 
 
-@dataclass
+@dataclass(slots=True)
 class PathsConfig:
     """File path configuration."""
     root: Path = field(default_factory=Path.cwd)
@@ -46,19 +66,19 @@ class PathsConfig:
     prompts: Path = field(default_factory=lambda: Path("seaa/cortex/prompts"))
     logs: Path = field(default_factory=lambda: Path("logs"))
     
+    # Fields anchored under root when given as relative paths
+    _RELATIVE_FIELDS = ("dna", "soma", "prompts", "logs")
+
     def __post_init__(self):
         # Make paths absolute
-        if not self.dna.is_absolute():
-            self.dna = self.root / self.dna
-        if not self.soma.is_absolute():
-            self.soma = self.root / self.soma
-        if not self.prompts.is_absolute():
-            self.prompts = self.root / self.prompts
-        if not self.logs.is_absolute():
-            self.logs = self.root / self.logs
+        root = self.root
+        for name in self._RELATIVE_FIELDS:
+            p = getattr(self, name)
+            if not p.is_absolute():
+                setattr(self, name, root / p)
 
 
-@dataclass
+@dataclass(slots=True)
 class MetabolismConfig:
     """Metabolic cycle configuration."""
     cycle_interval_seconds: int = 30
@@ -66,16 +86,17 @@ class MetabolismConfig:
     reflection_timeout_seconds: int = 60
     max_concurrent_organs: int = 20
     max_total_organs: int = 50
+    max_concurrent_generations: int = 3
 
 
-@dataclass
+@dataclass(slots=True)
 class CircuitBreakerConfig:
     """Circuit breaker configuration for failing organs."""
     max_attempts: int = 3
     cooldown_minutes: int = 30
 
 
-@dataclass
+@dataclass(slots=True)
 class SecurityConfig:
     """Security configuration."""
     allow_pip_install: bool = False  # DISABLED BY DEFAULT for security
@@ -93,7 +114,7 @@ class SecurityConfig:
     ])
 
 
-@dataclass
+@dataclass(slots=True)
 class LoggingConfig:
     """Logging configuration."""
     level: str = "INFO"
@@ -101,7 +122,7 @@ class LoggingConfig:
     file: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class GenealogyConfig:
     """Evolutionary Memory (Git) configuration."""
     enabled: bool = True
@@ -109,14 +130,14 @@ class GenealogyConfig:
     user_email: str = "genesis@seaa.internal"
 
 
-@dataclass
+@dataclass(slots=True)
 class EventBusConfig:
     """Event bus configuration."""
     # Number of events to retain in memory for debugging
     max_retained_events: int = 100
 
 
-@dataclass
+@dataclass(slots=True)
 class RemoteLoggingConfig:
     """Remote logging configuration."""
     enabled: bool = False
@@ -127,7 +148,7 @@ class RemoteLoggingConfig:
     min_level: str = "WARNING"
 
 
-@dataclass
+@dataclass(slots=True)
 class APIConfig:
     """API server configuration (for soma.interface.web_api)."""
     host: str = "0.0.0.0"
@@ -141,7 +162,7 @@ class APIConfig:
     websocket_timeout_seconds: int = 300
 
 
-@dataclass
+@dataclass(slots=True)
 class DatabaseConfig:
     """Database configuration (for soma.storage.sqlite)."""
     engine: str = "sqlite"  # "sqlite", "postgres", etc.
@@ -150,7 +171,7 @@ class DatabaseConfig:
     echo: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class MetricsConfig:
     """Metrics collection configuration (for soma.extensions.metrics)."""
     enabled: bool = True
@@ -158,7 +179,22 @@ class MetricsConfig:
     collection_interval_seconds: int = 5
 
 
-@dataclass
+# env var -> (config section or None for top-level, attribute, converter).
+# Declarative so the override pass is one loop; insertion order defines
+# precedence (OLLAMA_MODEL wins over SEAA_LLM_MODEL when both are set).
+_SEAAM_ENV_MAP = {
+    "SEAA_LLM_PROVIDER": ("llm", "provider", None),
+    "SEAA_LLM_MODEL": ("llm", "model", None),
+    "OLLAMA_URL": ("llm", "ollama_url", None),
+    "OLLAMA_MODEL": ("llm", "model", None),
+    "SEAA_LOG_LEVEL": ("logging", "level", None),
+    "SEAA_LOG_FORMAT": ("logging", "format", None),
+    "SEAA_ALLOW_PIP": ("security", "allow_pip_install", lambda v: v.lower() == "true"),
+    "SEAA_ENV": (None, "environment", None),
+}
+
+
+@dataclass(slots=True)
 class SEAAConfig:
     """Root configuration object."""
     llm: LLMConfig = field(default_factory=LLMConfig)
@@ -177,82 +213,60 @@ class SEAAConfig:
     # Metadata
     version: str = "1.0.0"
     environment: str = "development"
+
+    # Fsync data and directory entries on materialization writes.
+    # Disable only if crash-durability of generated organs doesn't matter.
+    durable_writes: bool = True
     
+    # Sections handled generically by from_dict: copy recognized keys
+    # onto the matching sub-config. paths/version/environment/
+    # durable_writes have special semantics and are handled explicitly.
+    _SECTIONS = (
+        "llm",
+        "metabolism",
+        "security",
+        "logging",
+        "genealogy",
+        "circuit_breaker",
+        "event_bus",
+        "remote_logging",
+        "api",
+        "database",
+        "metrics",
+    )
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "SEAAConfig":
         """Create config from a dictionary."""
         config = cls()
-        
-        if "llm" in data:
-            for key, value in data["llm"].items():
-                if hasattr(config.llm, key):
-                    setattr(config.llm, key, value)
-        
+
+        for name in cls._SECTIONS:
+            section = data.get(name)
+            if not section:
+                continue
+            target = getattr(config, name)
+            for key, value in section.items():
+                if hasattr(target, key):
+                    setattr(target, key, value)
+
         if "paths" in data:
             paths_data = data["paths"]
-            if "root" in paths_data:
-                config.paths.root = Path(paths_data["root"])
-            if "dna" in paths_data:
-                config.paths.dna = Path(paths_data["dna"])
-            if "soma" in paths_data:
-                config.paths.soma = Path(paths_data["soma"])
-            # Recalculate absolute paths
-            config.paths.__post_init__()
-        
-        if "metabolism" in data:
-            for key, value in data["metabolism"].items():
-                if hasattr(config.metabolism, key):
-                    setattr(config.metabolism, key, value)
-        
-        if "security" in data:
-            for key, value in data["security"].items():
-                if hasattr(config.security, key):
-                    setattr(config.security, key, value)
-        
-        if "logging" in data:
-            for key, value in data["logging"].items():
-                if hasattr(config.logging, key):
-                    setattr(config.logging, key, value)
-        
-        if "genealogy" in data:
-            for key, value in data["genealogy"].items():
-                if hasattr(config.genealogy, key):
-                    setattr(config.genealogy, key, value)
-
-        if "circuit_breaker" in data:
-            for key, value in data["circuit_breaker"].items():
-                if hasattr(config.circuit_breaker, key):
-                    setattr(config.circuit_breaker, key, value)
-
-        if "event_bus" in data:
-            for key, value in data["event_bus"].items():
-                if hasattr(config.event_bus, key):
-                    setattr(config.event_bus, key, value)
-
-        if "remote_logging" in data:
-            for key, value in data["remote_logging"].items():
-                if hasattr(config.remote_logging, key):
-                    setattr(config.remote_logging, key, value)
-
-        if "api" in data:
-            for key, value in data["api"].items():
-                if hasattr(config.api, key):
-                    setattr(config.api, key, value)
-
-        if "database" in data:
-            for key, value in data["database"].items():
-                if hasattr(config.database, key):
-                    setattr(config.database, key, value)
-
-        if "metrics" in data:
-            for key, value in data["metrics"].items():
-                if hasattr(config.metrics, key):
-                    setattr(config.metrics, key, value)
+            # Build a fresh PathsConfig so __post_init__ anchors the
+            # relative fields exactly once, instead of mutating the
+            # default instance and re-running it
+            kwargs = {
+                key: Path(paths_data[key])
+                for key in ("root", "dna", "soma")
+                if key in paths_data
+            }
+            config.paths = PathsConfig(**kwargs)
 
         if "version" in data:
             config.version = data["version"]
         if "environment" in data:
             config.environment = data["environment"]
+        if "durable_writes" in data:
+            config.durable_writes = bool(data["durable_writes"])
 
         return config
     
@@ -275,44 +289,104 @@ class SEAAConfig:
             config_path = Path(config_path)
         
         if config_path.exists() and HAS_YAML:
-            with open(config_path) as f:
-                data = yaml.safe_load(f)
-                if data:
-                    config = cls.from_dict(data)
+            data = cls._parse_yaml_cached(config_path)
+            if data:
+                config = cls.from_dict(data)
         
         # Override with environment variables
         config._apply_env_overrides()
         
         return config
     
+    # Top-level keys a truncated header parse must cover before we
+    # trust it instead of parsing the whole document: everything
+    # from_dict consumes. Configs that omit optional sections simply
+    # take the full-parse path - correctness over the shortcut
+    _HEADER_KEYS = frozenset(_SECTIONS) | {
+        "paths",
+        "version",
+        "environment",
+        "durable_writes",
+    }
+
+    @classmethod
+    def _header_parse_complete(cls, data: Dict[str, Any]) -> bool:
+        """
+        Decide whether a truncated parse can be trusted.
+
+        All consumed sections must be present AND at least one other
+        top-level key must follow the last of them in document order -
+        proof the truncation fell after every section we care about
+        rather than inside one (a cut mid-list still parses cleanly but
+        silently drops entries, e.g. security.protected_prefixes).
+        """
+        if not cls._HEADER_KEYS <= data.keys():
+            return False
+        keys = list(data)
+        last_header = max(keys.index(k) for k in cls._HEADER_KEYS)
+        return last_header < len(keys) - 1
+
+    @classmethod
+    def _parse_yaml(cls, config_path: Path) -> Optional[Dict[str, Any]]:
+        """
+        Parse config.yaml, reading only a bounded prefix when large.
+
+        Deployments can balloon the file with package lists and organ
+        metadata while the loader consumes only ~10 top-level keys. For
+        big files, try parsing the first 8 KiB (the '...' document-end
+        token makes a clean truncation valid YAML) and accept it when
+        the expected sections are demonstrably complete; otherwise
+        parse everything.
+        """
+        text = config_path.read_text()
+        if len(text) > 32_768:
+            # Truncate at a line boundary so we don't cut a token in half
+            head = text[:8192]
+            head = head[:head.rfind("\n") + 1] + "...\n"
+            try:
+                data = yaml.load(head, Loader=_YamlLoader)
+                if isinstance(data, dict) and cls._header_parse_complete(data):
+                    return data
+            except yaml.YAMLError:
+                pass
+        return yaml.load(text, Loader=_YamlLoader)
+
+    @classmethod
+    def _parse_yaml_cached(cls, config_path: Path) -> Optional[Dict[str, Any]]:
+        """
+        Cache the parsed config dict next to the file as a pickle.
+
+        The pickle loads an order of magnitude faster than re-parsing
+        YAML and is invalidated whenever the source's (mtime_ns, size)
+        changes. Cache I/O failures are non-fatal - we just parse.
+        """
+        stat = config_path.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cache_path = config_path.with_suffix(".yaml.cache")
+        try:
+            with open(cache_path, "rb") as f:
+                cached_stamp, data = pickle.load(f)
+            if cached_stamp == stamp:
+                return data
+        except (OSError, pickle.UnpicklingError, ValueError, EOFError):
+            pass
+
+        data = cls._parse_yaml(config_path)
+        try:
+            with open(cache_path, "wb") as f:
+                pickle.dump((stamp, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            pass
+        return data
+
     def _apply_env_overrides(self) -> None:
-        """Apply environment variable overrides."""
-        # LLM settings
-        if os.environ.get("SEAA_LLM_PROVIDER"):
-            self.llm.provider = os.environ["SEAA_LLM_PROVIDER"]
-        if os.environ.get("SEAA_LLM_MODEL"):
-            self.llm.model = os.environ["SEAA_LLM_MODEL"]
-        if os.environ.get("OLLAMA_URL"):
-            self.llm.ollama_url = os.environ["OLLAMA_URL"]
-        if os.environ.get("OLLAMA_MODEL"):
-            self.llm.model = os.environ["OLLAMA_MODEL"]
-        if os.environ.get("GEMINI_API_KEY"):
-            # If Gemini key is set, we know it's available
-            pass  # Just noting it exists
-        
-        # Logging
-        if os.environ.get("SEAA_LOG_LEVEL"):
-            self.logging.level = os.environ["SEAA_LOG_LEVEL"]
-        if os.environ.get("SEAA_LOG_FORMAT"):
-            self.logging.format = os.environ["SEAA_LOG_FORMAT"]
-        
-        # Security
-        if os.environ.get("SEAA_ALLOW_PIP"):
-            self.security.allow_pip_install = os.environ["SEAA_ALLOW_PIP"].lower() == "true"
-        
-        # Environment
-        if os.environ.get("SEAA_ENV"):
-            self.environment = os.environ["SEAA_ENV"]
+        """Apply environment variable overrides in one pass over the map."""
+        env = os.environ
+        for name, (section, attr, conv) in _SEAAM_ENV_MAP.items():
+            value = env.get(name)
+            if value is not None:
+                target = self if section is None else getattr(self, section)
+                setattr(target, attr, conv(value) if conv else value)
     
     def validate(self) -> List[str]:
         """
@@ -347,6 +421,9 @@ class SEAAConfig:
         if self.metabolism.max_organs_per_cycle < 1:
             errors.append(f"max_organs_per_cycle must be >= 1, got {self.metabolism.max_organs_per_cycle}")
 
+        if self.metabolism.max_concurrent_generations < 1:
+            errors.append(f"max_concurrent_generations must be >= 1, got {self.metabolism.max_concurrent_generations}")
+
         # Circuit breaker
         if self.circuit_breaker.max_attempts < 1:
             errors.append(f"Circuit breaker max_attempts must be >= 1, got {self.circuit_breaker.max_attempts}")
@@ -365,12 +442,18 @@ class SEAAConfig:
         return {
             "version": self.version,
             "environment": self.environment,
+            "durable_writes": self.durable_writes,
             "llm": {
                 "provider": self.llm.provider,
                 "model": self.llm.model,
                 "temperature": self.llm.temperature,
                 "max_retries": self.llm.max_retries,
                 "timeout_seconds": self.llm.timeout_seconds,
+                "connect_timeout_seconds": self.llm.connect_timeout_seconds,
+                "max_output_tokens": self.llm.max_output_tokens,
+                "concurrency": self.llm.concurrency,
+                "gemini_qpm": self.llm.gemini_qpm,
+                "ollama_qpm": self.llm.ollama_qpm,
                 "ollama_url": self.llm.ollama_url,
                 "gemini_model": self.llm.gemini_model,
             },
@@ -384,6 +467,7 @@ class SEAAConfig:
                 "max_organs_per_cycle": self.metabolism.max_organs_per_cycle,
                 "max_concurrent_organs": self.metabolism.max_concurrent_organs,
                 "max_total_organs": self.metabolism.max_total_organs,
+                "max_concurrent_generations": self.metabolism.max_concurrent_generations,
             },
             "security": {
                 "allow_pip_install": self.security.allow_pip_install,
@@ -405,5 +489,25 @@ class SEAAConfig:
         }
 
 
-# Global config instance
-config = SEAAConfig.load()
+# Global config instance, built lazily.
+#
+# Loading eagerly at import made every importer - including ones that
+# only want an exception class - pay for a cwd lookup, a stat, a YAML
+# parse and a dozen environment probes. The PEP 562 module __getattr__
+# keeps `from seaa.core.config import config` working unchanged while
+# deferring the load to first use.
+_config: Optional[SEAAConfig] = None
+
+
+def get_config() -> SEAAConfig:
+    """Get the process-wide configuration, loading it on first use."""
+    global _config
+    if _config is None:
+        _config = SEAAConfig.load()
+    return _config
+
+
+def __getattr__(name: str) -> Any:
+    if name == "config":
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
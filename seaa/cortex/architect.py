@@ -12,18 +12,58 @@ Responsibilities:
 
 import json
 import re
-from typing import Callable, Optional
+import sys
+from typing import Callable, List, Optional
+
+# Optional fast path: orjson parses/serializes 2-3x faster than stdlib
+# json. Both raise ValueError subclasses on bad input, so callers catch
+# ValueError and work with either backend. Output is compact - these
+# strings are embedded in prompts, where indent whitespace only costs
+# input tokens.
+try:
+    import orjson
+
+    def _loads(s: str) -> dict:
+        return orjson.loads(s)
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj) -> str:
+        return json.dumps(obj, separators=(",", ":"))
 
 from seaa.core.logging import get_logger
-from seaa.core.config import config
-from seaa.dna.schema import DNA, Goal
+from seaa.dna.schema import DNA, FailureType, Goal
 from seaa.cortex.prompt_loader import prompt_loader
 
 # Security: Strict module name pattern - only valid Python identifiers under soma.*
-MODULE_NAME_PATTERN = re.compile(r'^soma(\.[a-z_][a-z0-9_]*)+$', re.IGNORECASE)
+# Must stay aligned with the Materializer's pattern: case-sensitive
+# (a name accepted here would otherwise be rejected by materialize()
+# every cycle until the circuit breaker opens) and ASCII-only
+MODULE_NAME_PATTERN = re.compile(r'^soma(\.[a-z_][a-z0-9_]*)+$', re.ASCII)
+
+# Compiled once - _clean_json_string runs on the reflect hot path
+_CODE_FENCE_RE = re.compile(r"```(?:[a-zA-Z]+)?\n?(.*?)```", re.DOTALL)
+_TRAILING_COMMA_OBJ = re.compile(r",\s*}")
+_TRAILING_COMMA_ARR = re.compile(r",\s*]")
+
+# ImportError text emitted by CPython for an unresolvable module
+_MISSING_MODULE_RE = re.compile(r"No module named '([\w.]+)'")
+
+# Marker showing a blueprint already carries the mechanical import fix
+_IMPORT_CONSTRAINT_MARK = "IMPORT CONSTRAINT:"
 
 logger = get_logger("architect")
 
+# Token budget for the reflection prompt: prefill cost scales with
+# input size, so only the most recent failures and a capped slice of
+# each blueprint description are embedded.
+MAX_PROMPT_FAILURES = 3
+MAX_BLUEPRINT_DESC_CHARS = 200
+
 
 class Architect:
     """
@@ -47,6 +87,16 @@ class Architect:
         self.dna = dna
         self.gateway = gateway
         self.save_dna = save_callback
+        # (state signature, rendered prompt) - reflection re-renders a
+        # multi-KB template every cycle even when DNA hasn't changed
+        self._prompt_cache: Optional[tuple] = None
+        # (state signature, (goals, blueprint, failures)) - the derived
+        # views both prompt builders recompute from DNA every call
+        self._views_cache: Optional[tuple] = None
+        self._fallback_cache: Optional[tuple] = None
+        # Signature of the DNA state the last LLM reflection saw -
+        # identical state would just replay the same answer
+        self._last_reflect_sig: Optional[int] = None
     
     def reflect(self) -> bool:
         """
@@ -58,7 +108,22 @@ class Architect:
         # Check if we should reflect
         if not self._should_reflect():
             return False
-        
+
+        # Skip the LLM round-trip entirely when nothing the prompt
+        # depends on has changed since the last reflection. Failures are
+        # exempt: retrying them is the point of reflecting again.
+        sig = self._dna_signature()
+        if sig == self._last_reflect_sig and not self.dna.failures:
+            logger.debug("DNA unchanged since last reflection, skipping")
+            return False
+
+        # Purely mechanical decisions don't need a model - resolve them
+        # in Python and save the multi-second LLM round-trip
+        ruled = self._rule_based_decide()
+        if ruled is not None:
+            self._last_reflect_sig = self._dna_signature()
+            return ruled
+
         logger.info("Reflecting on existence...")
         
         # Build prompt using template
@@ -76,8 +141,11 @@ class Architect:
             logger.warning("No response from Overmind")
             return False
         
-        # Parse and apply the response
-        return self._process_response(response)
+        # Parse and apply the response; remember what state it answered
+        # for, whether or not it changed DNA
+        result = self._process_response(response)
+        self._last_reflect_sig = sig
+        return result
     
     def _should_reflect(self) -> bool:
         """
@@ -102,50 +170,144 @@ class Architect:
         
         return True
     
-    def _build_reflect_prompt(self) -> str:
-        """Build the reflection prompt from template."""
-        # Prepare data for template
-        goals = [g.description for g in self.dna.goals if not g.satisfied]
+    def _rule_based_decide(self) -> Optional[bool]:
+        """
+        Resolve mechanically-decidable reflections without the LLM.
 
-        blueprint = {
-            name: bp.description
-            for name, bp in self.dna.blueprint.items()
-        }
+        Returns:
+            True/False if the reflection was fully handled in Python
+            (same contract as reflect()), or None to fall through to
+            the model.
+        """
+        # All goals satisfied and nothing failing: the model could only
+        # answer COMPLETE or invent a new goal - goal evolution is worth
+        # a real reflection, so only conclude when goals exist and every
+        # one is already satisfied
+        if (
+            not self.dna.failures
+            and self.dna.goals
+            and all(g.satisfied for g in self.dna.goals)
+        ):
+            logger.info("All goals satisfied - content without consulting Overmind")
+            return False
 
-        failures = [
-            f"{f.module_name}: {f.error_message} (attempts: {f.attempt_count})"
-            for f in self.dna.failures
-        ]
+        # Import failures naming a missing package have an obvious fix:
+        # constrain the blueprint to the sanctioned imports. Applied at
+        # most once per organ so repeated failures escalate to the LLM.
+        for failure in self.dna.failures:
+            if failure.error_type != FailureType.IMPORT:
+                continue
+            match = _MISSING_MODULE_RE.search(failure.error_message)
+            if not match:
+                continue
+            missing = match.group(1)
+            bp = self.dna.blueprint.get(failure.module_name)
+            if bp is None or _IMPORT_CONSTRAINT_MARK in bp.description:
+                continue
+            logger.info(
+                f"Rule-based fix: constraining imports for {failure.module_name} "
+                f"(missing '{missing}')"
+            )
+            self.dna.add_blueprint(
+                failure.module_name,
+                bp.description
+                + f" {_IMPORT_CONSTRAINT_MARK} Do NOT import '{missing}' - it is "
+                "not available. Use only the Python standard library, "
+                "seaa.kernel.bus, seaa.core.logging and seaa.core.config.",
+            )
+            self.save_dna()
+            return True
 
-        # Include active modules so LLM knows what's running
-        active_modules = self.dna.active_modules
+        return None
 
-        return prompt_loader.render(
+    def _dna_signature(self) -> int:
+        """
+        Cheap hash of the DNA state the reflection prompt depends on.
+
+        Two cycles with equal signatures would render byte-identical
+        prompts, so the signature gates both the prompt cache and
+        short-circuit checks.
+        """
+        return hash((
+            tuple(g.description for g in self.dna.goals if not g.satisfied),
+            tuple(
+                (name, bp.description, bp.version)
+                for name, bp in sorted(self.dna.blueprint.items())
+            ),
+            tuple(
+                (f.module_name, f.error_message, f.attempt_count)
+                for f in self.dna.failures
+            ),
+            tuple(self.dna.active_modules),
+        ))
+
+    def _dna_views(self, sig: int) -> tuple:
+        """
+        Derived (goals, blueprint, failures) views of DNA for prompts.
+
+        Rebuilt only when the DNA signature changes; both the template
+        and fallback prompt builders consume the same snapshot.
+        """
+        if self._views_cache is not None and self._views_cache[0] == sig:
+            return self._views_cache[1]
+
+        views = (
+            [g.description for g in self.dna.goals if not g.satisfied],
+            {
+                name: bp.description[:MAX_BLUEPRINT_DESC_CHARS]
+                for name, bp in self.dna.blueprint.items()
+            },
+            [
+                f"{f.module_name}: {f.error_message} (attempts: {f.attempt_count})"
+                for f in self.dna.failures[-MAX_PROMPT_FAILURES:]
+            ],
+        )
+        self._views_cache = (sig, views)
+        return views
+
+    def _build_reflect_prompt(self) -> str:
+        """Build the reflection prompt from template."""
+        sig = self._dna_signature()
+        if self._prompt_cache is not None and self._prompt_cache[0] == sig:
+            return self._prompt_cache[1]
+
+        goals, blueprint, failures = self._dna_views(sig)
+
+        prompt = prompt_loader.render(
             "architect_reflect",
             goals=goals,
             blueprint=blueprint,
             failures=failures,
-            active_modules=active_modules,
+            # Include active modules so LLM knows what's running
+            active_modules=self.dna.active_modules,
         )
-    
+        self._prompt_cache = (sig, prompt)
+        return prompt
+
     def _build_fallback_prompt(self) -> str:
         """Fallback inline prompt if template loading fails."""
-        goals = [g.description for g in self.dna.goals if not g.satisfied]
-        blueprint = {name: bp.description for name, bp in self.dna.blueprint.items()}
-        failures = [f"{f.module_name}: {f.error_message}" for f in self.dna.failures]
-        
-        return f"""
+        # Memoized like the template path: the JSON serialization below
+        # is the expensive part and only changes with the DNA signature
+        sig = self._dna_signature()
+        if self._fallback_cache is not None and self._fallback_cache[0] == sig:
+            return self._fallback_cache[1]
+
+        goals, blueprint, failures = self._dna_views(sig)
+
+        prompt = f"""
         You are the 'Architect' of a self-evolving AI system.
-        
-        GOALS: {json.dumps(goals, indent=2)}
-        BLUEPRINT: {json.dumps(blueprint, indent=2)}
-        FAILURES: {json.dumps(failures, indent=2)}
-        
+
+        GOALS: {_dumps(goals)}
+        BLUEPRINT: {_dumps(blueprint)}
+        FAILURES: {_dumps(failures)}
+
         Analyze the goals vs blueprint. Propose the next organ as JSON:
         {{"module_name": "soma.category.name", "description": "..."}}
-        
+
         Or return {{"module_name": "COMPLETE"}} if satisfied.
         """
+        self._fallback_cache = (sig, prompt)
+        return prompt
     
     def _validate_module_name(self, module_name: str) -> bool:
         """
@@ -191,66 +353,30 @@ class Architect:
         """
         Parse and apply the Architect's response.
 
+        Accepts either a single decision object or a JSON array of
+        decisions - batching several organs into one reflection
+        amortizes the per-call prompt and network cost across them.
+
         SECURITY: Validates module names from LLM to prevent injection attacks.
 
         Returns:
             True if DNA was modified
         """
         try:
-            # Extract JSON from response
-            json_data = self._extract_json(response)
+            decisions = self._extract_decisions(response)
 
-            if not json_data:
+            if not decisions:
                 if "COMPLETE" in response.upper():
                     logger.info("Content with current form")
                 else:
                     logger.warning(f"Unstructured thought: {response[:100]}...")
                 return False
 
-            # Parse the plan
-            module_name = json_data.get("module_name")
-            description = json_data.get("description")
-            new_goal = json_data.get("new_goal")
-
-            # SECURITY: Validate module name before using it
-            if module_name and not self._validate_module_name(module_name):
-                logger.error(f"Security: Rejected invalid module name from LLM: {module_name}")
-                return False
-            
-            # Check for completion
-            if module_name == "COMPLETE":
-                logger.info("Purpose fulfilled for now")
-                return False
-            
             modified = False
-            
-            # Handle goal evolution
-            if new_goal:
-                existing_goals = [g.description for g in self.dna.goals]
-                if new_goal not in existing_goals:
-                    logger.info(f"Purpose Evolved: {new_goal}")
-                    self.dna.goals.append(Goal(description=new_goal))
-                    modified = True
-            
-            # Handle blueprint
-            if module_name and description:
-                # Check if this is a new organ or a fix for failing one
-                is_failing = any(
-                    module_name in f.module_name
-                    for f in self.dna.failures
-                )
-                
-                if module_name not in self.dna.blueprint:
-                    logger.info(f"Decided to evolve: {module_name}")
-                    self.dna.add_blueprint(module_name, description)
+            for decision in decisions:
+                if self._apply_decision(decision):
                     modified = True
-                elif is_failing:
-                    logger.info(f"Refining blueprint for failing organ: {module_name}")
-                    self.dna.add_blueprint(module_name, description)
-                    modified = True
-                else:
-                    logger.debug(f"{module_name} is already operational")
-            
+
             if modified:
                 self.save_dna()
 
@@ -266,6 +392,84 @@ class Architect:
             logger.error(f"Failed to process response: {e}")
             logger.debug(f"Raw response: {response[:200]}...")
             return False
+
+    def _extract_decisions(self, response: str) -> List[dict]:
+        """Extract decision objects: a decision array, or one object."""
+        # An array opening before the first object means the model chose
+        # the batch form; parse from there to the closing bracket.
+        first_bracket = response.find("[")
+        first_brace = response.find("{")
+        if first_bracket >= 0 and (first_brace < 0 or first_bracket < first_brace):
+            last_bracket = response.rfind("]")
+            if last_bracket > first_bracket:
+                try:
+                    data = _loads(
+                        self._clean_json_string(response[first_bracket:last_bracket + 1])
+                    )
+                    if isinstance(data, list):
+                        return [d for d in data if isinstance(d, dict)]
+                except ValueError:
+                    pass
+
+        json_data = self._extract_json(response)
+        return [json_data] if json_data else []
+
+    def _apply_decision(self, json_data: dict) -> bool:
+        """
+        Apply one parsed decision to DNA.
+
+        Returns:
+            True if DNA was modified (caller is responsible for saving)
+        """
+        # Parse the plan. Intern the module name: the same handful
+        # of names flows through blueprint keys, failure records and
+        # active_modules, so comparisons become pointer checks.
+        module_name = json_data.get("module_name")
+        if isinstance(module_name, str):
+            module_name = sys.intern(module_name)
+        description = json_data.get("description")
+        new_goal = json_data.get("new_goal")
+
+        # SECURITY: Validate module name before using it
+        if module_name and not self._validate_module_name(module_name):
+            logger.error(f"Security: Rejected invalid module name from LLM: {module_name}")
+            return False
+
+        # Check for completion
+        if module_name == "COMPLETE":
+            logger.info("Purpose fulfilled for now")
+            return False
+
+        modified = False
+
+        # Handle goal evolution
+        if new_goal:
+            existing_goals = [g.description for g in self.dna.goals]
+            if new_goal not in existing_goals:
+                logger.info(f"Purpose Evolved: {new_goal}")
+                self.dna.goals.append(Goal(description=new_goal))
+                modified = True
+
+        # Handle blueprint
+        if module_name and description:
+            # Check if this is a new organ or a fix for a failing one.
+            # Exact-equality index probe: the old substring test was
+            # O(failures) per response and misclassified "soma.x"
+            # as failing when "soma.xyz" had a failure record.
+            is_failing = self.dna.has_failure(module_name)
+
+            if module_name not in self.dna.blueprint:
+                logger.info(f"Decided to evolve: {module_name}")
+                self.dna.add_blueprint(module_name, description)
+                modified = True
+            elif is_failing:
+                logger.info(f"Refining blueprint for failing organ: {module_name}")
+                self.dna.add_blueprint(module_name, description)
+                modified = True
+            else:
+                logger.debug(f"{module_name} is already operational")
+
+        return modified
     
     def _extract_json(self, text: str) -> Optional[dict]:
         """
@@ -274,13 +478,19 @@ class Architect:
         Handles LLMs that include extra text around JSON.
         SECURITY: Uses proper depth tracking instead of first/last brace matching.
         """
+        # Skip leading prose in C before the Python-level scan begins
+        first_brace = text.find("{")
+        if first_brace < 0:
+            return None
+
         # Find first complete JSON object using proper depth tracking
         depth = 0
         start_idx = -1
         in_string = False
         escape_next = False
 
-        for i, char in enumerate(text):
+        for i in range(first_brace, len(text)):
+            char = text[i]
             if escape_next:
                 escape_next = False
                 continue
@@ -305,17 +515,17 @@ class Architect:
                 if depth == 0 and start_idx != -1:
                     json_str = text[start_idx:i + 1]
                     try:
-                        result = json.loads(json_str)
+                        result = _loads(json_str)
                         if isinstance(result, dict):
                             return result
-                    except json.JSONDecodeError:
+                    except ValueError:
                         # Try cleaning and parsing again
                         cleaned = self._clean_json_string(json_str)
                         try:
-                            result = json.loads(cleaned)
+                            result = _loads(cleaned)
                             if isinstance(result, dict):
                                 return result
-                        except json.JSONDecodeError:
+                        except ValueError:
                             pass
                     # Reset and try to find next JSON object
                     start_idx = -1
@@ -328,21 +538,12 @@ class Architect:
         """
         # Remove markdown code fences if present - keep content INSIDE fences
         if "```" in text:
-            lines = []
-            in_fence = False
-            for line in text.split("\n"):
-                if line.strip().startswith("```"):
-                    in_fence = not in_fence
-                    continue
-                if in_fence:
-                    lines.append(line)
-            # Only use extracted lines if we found fenced content
-            if lines:
-                text = "\n".join(lines)
+            matches = _CODE_FENCE_RE.findall(text)
+            if matches:
+                text = "\n".join(matches)
 
         # Remove trailing commas (common LLM error)
-        import re
-        text = re.sub(r",\s*}", "}", text)
-        text = re.sub(r",\s*]", "]", text)
+        text = _TRAILING_COMMA_OBJ.sub("}", text)
+        text = _TRAILING_COMMA_ARR.sub("]", text)
 
         return text
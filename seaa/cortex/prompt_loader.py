@@ -61,13 +61,17 @@ class PromptTemplate:
             if var in kwargs:
                 value = kwargs[var]
                 
-                # Handle tojson filter
+                # Handle tojson filter. Compact separators: prompts are
+                # machine-consumed, and indent whitespace inflates the
+                # token count by 20-40% for no model-quality benefit
                 if json_placeholder in result:
-                    result = result.replace(json_placeholder, json.dumps(value, indent=2))
-                
+                    result = result.replace(
+                        json_placeholder, json.dumps(value, separators=(",", ":"))
+                    )
+
                 # Handle regular placeholder
                 if isinstance(value, (dict, list)):
-                    str_value = json.dumps(value, indent=2)
+                    str_value = json.dumps(value, separators=(",", ":"))
                 else:
                     str_value = str(value)
                 
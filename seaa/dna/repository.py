@@ -181,9 +181,8 @@ class DNARepository:
             # Update metadata
             dna.metadata.last_modified = datetime.utcnow().isoformat() + "Z"
 
-            # Serialize to JSON
-            json_content = json.dumps(dna.to_dict(), indent=2)
-            content_bytes = json_content.encode('utf-8')
+            # Serialize to JSON (orjson-backed when available)
+            content_bytes = dna.to_json().encode('utf-8')
 
             # Write to temp file
             temp_path = self.dna_path.with_suffix(".tmp")
@@ -5,12 +5,48 @@ Strongly-typed Pydantic models for DNA validation.
 Ensures data integrity and provides clear structure.
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Optional, Union, List, Dict
 from dataclasses import dataclass, field, asdict
 from enum import Enum
 import fnmatch
 import json
+import sys
+import time
+
+# Optional fast path for DNA serialization: orjson encodes the dict
+# graph 5-10x faster than stdlib json. to_dict() stays the single
+# source of the on-disk layout (it converts enums and skips derived
+# fields); orjson only replaces the encode step.
+try:
+    import orjson
+
+    def _dumps_indent2(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+except ImportError:
+    def _dumps_indent2(obj) -> str:
+        return json.dumps(obj, indent=2)
+
+# Timestamps here only need second resolution, and bursts of failures
+# or blueprint updates stamp many objects within the same tick - cache
+# the formatted string and rebuild it once per wall-clock second.
+_NOW_CACHE = (0, "")
+
+
+def _now_iso() -> str:
+    """Current UTC time as an ISO-8601 'Z' string, cached per second."""
+    global _NOW_CACHE
+    second = time.time_ns() // 1_000_000_000
+    cached_second, cached = _NOW_CACHE
+    if second != cached_second:
+        cached = (
+            datetime.fromtimestamp(second, tz=timezone.utc)
+            .isoformat(timespec="seconds")
+            .replace("+00:00", "Z")
+        )
+        _NOW_CACHE = (second, cached)
+    return cached
 
 
 class FailureType(str, Enum):
@@ -33,7 +69,7 @@ class Failure:
     module_name: str
     error_type: FailureType
     error_message: str
-    timestamp: str = field(default_factory=lambda: datetime.utcnow().isoformat() + "Z")
+    timestamp: str = field(default_factory=_now_iso)
     attempt_count: int = 1
     context: Dict[str, Any] = field(default_factory=dict)
     # Circuit breaker fields
@@ -62,10 +98,10 @@ class Failure:
                 error_type = FailureType.RUNTIME
 
         return cls(
-            module_name=data["module_name"],
+            module_name=sys.intern(data["module_name"]),
             error_type=error_type,
             error_message=data.get("error_message", "Unknown error"),
-            timestamp=data.get("timestamp", datetime.utcnow().isoformat() + "Z"),
+            timestamp=data.get("timestamp", _now_iso()),
             attempt_count=data.get("attempt_count", 1),
             context=data.get("context", {}),
             circuit_open=data.get("circuit_open", False),
@@ -99,9 +135,29 @@ class OrganBlueprint:
     description: str
     dependencies: List[str] = field(default_factory=list)
     version: int = 1
-    created_at: str = field(default_factory=lambda: datetime.utcnow().isoformat() + "Z")
-    updated_at: str = field(default_factory=lambda: datetime.utcnow().isoformat() + "Z")
-    
+    created_at: str = field(default_factory=_now_iso)
+    updated_at: str = field(default_factory=_now_iso)
+
+    def __post_init__(self):
+        self._compile_dependencies()
+
+    def _compile_dependencies(self) -> None:
+        """
+        Precompute (dep, is_wildcard, prefix) triples for dependency checks.
+
+        Parsing wildcards once here means satisfaction checks in the
+        evolution loop avoid re-running str.replace per dependency per cycle.
+        Must be re-run whenever `dependencies` is reassigned.
+        """
+        self._compiled_deps = [
+            (dep, "*" in dep, dep.replace("*", "")) for dep in self.dependencies
+        ]
+
+    @property
+    def compiled_dependencies(self) -> List[tuple]:
+        """Precompiled (dep, is_wildcard, prefix) triples for fast checks."""
+        return self._compiled_deps
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "name": self.name,
@@ -124,8 +180,8 @@ class OrganBlueprint:
             description=data.get("description", ""),
             dependencies=data.get("dependencies", []),
             version=data.get("version", 1),
-            created_at=data.get("created_at", datetime.utcnow().isoformat() + "Z"),
-            updated_at=data.get("updated_at", datetime.utcnow().isoformat() + "Z"),
+            created_at=data.get("created_at", _now_iso()),
+            updated_at=data.get("updated_at", _now_iso()),
         )
 
 
@@ -140,7 +196,7 @@ class Goal:
     description: str
     priority: int = 1  # 1 = highest priority
     satisfied: bool = False
-    created_at: str = field(default_factory=lambda: datetime.utcnow().isoformat() + "Z")
+    created_at: str = field(default_factory=_now_iso)
     required_organs: List[str] = field(default_factory=list)  # e.g., ["soma.perception.*"]
 
     def to_dict(self) -> Dict[str, Any]:
@@ -162,7 +218,7 @@ class Goal:
             description=data.get("description", ""),
             priority=data.get("priority", 1),
             satisfied=data.get("satisfied", False),
-            created_at=data.get("created_at", datetime.utcnow().isoformat() + "Z"),
+            created_at=data.get("created_at", _now_iso()),
             required_organs=data.get("required_organs", []),
         )
 
@@ -170,7 +226,7 @@ class Goal:
 @dataclass
 class DNAMetadata:
     """Metadata about the DNA itself."""
-    last_modified: str = field(default_factory=lambda: datetime.utcnow().isoformat() + "Z")
+    last_modified: str = field(default_factory=_now_iso)
     total_evolutions: int = 0
     total_failures: int = 0
     last_successful_organ: Optional[str] = None
@@ -181,7 +237,7 @@ class DNAMetadata:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "DNAMetadata":
         return cls(
-            last_modified=data.get("last_modified", datetime.utcnow().isoformat() + "Z"),
+            last_modified=data.get("last_modified", _now_iso()),
             total_evolutions=data.get("total_evolutions", 0),
             total_failures=data.get("total_failures", 0),
             last_successful_organ=data.get("last_successful_organ"),
@@ -202,7 +258,14 @@ class DNA:
     active_modules: List[str] = field(default_factory=list)
     failures: List[Failure] = field(default_factory=list)
     metadata: DNAMetadata = field(default_factory=DNAMetadata)
-    
+    # Derived O(1) index over failures - not serialized, not compared
+    _failure_by_module: Dict[str, Failure] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        self._failure_by_module = {f.module_name: f for f in self.failures}
+
     def to_dict(self) -> Dict[str, Any]:
         """Serialize to dictionary for JSON storage."""
         return {
@@ -219,15 +282,20 @@ class DNA:
     
     def to_json(self, indent: int = 2) -> str:
         """Serialize to JSON string."""
+        if indent == 2:
+            return _dumps_indent2(self.to_dict())
         return json.dumps(self.to_dict(), indent=indent)
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "DNA":
         """Deserialize from dictionary."""
-        # Parse blueprint
+        # Parse blueprint. Module names are interned here and below:
+        # the same strings recur across blueprint keys, failures and
+        # active_modules, so equality checks collapse to identity.
         blueprint = {}
         raw_blueprint = data.get("blueprint", {})
         for name, bp_data in raw_blueprint.items():
+            name = sys.intern(name)
             blueprint[name] = OrganBlueprint.from_dict(name, bp_data)
         
         # Parse goals (handle both legacy string list and new object list)
@@ -252,7 +320,7 @@ class DNA:
             system_name=data.get("system_name", "SEAA"),
             blueprint=blueprint,
             goals=goals,
-            active_modules=data.get("active_modules", []),
+            active_modules=[sys.intern(m) for m in data.get("active_modules", [])],
             failures=failures,
             metadata=metadata,
         )
@@ -264,29 +332,32 @@ class DNA:
     
     def add_failure(self, module_name: str, error_type: FailureType, message: str, context: Optional[dict] = None) -> None:
         """Record a failure, incrementing count if it already exists."""
-        # Check for existing failure for this module
-        for failure in self.failures:
-            if failure.module_name == module_name:
-                failure.attempt_count += 1
-                failure.error_type = error_type
-                failure.error_message = message
-                failure.timestamp = datetime.utcnow().isoformat() + "Z"
-                if context:
-                    failure.context.update(context)
-                return
-        
+        # O(1) probe against the index instead of scanning the list
+        failure = self._failure_by_module.get(module_name)
+        if failure is not None:
+            failure.attempt_count += 1
+            failure.error_type = error_type
+            failure.error_message = message
+            failure.timestamp = _now_iso()
+            if context:
+                failure.context.update(context)
+            return
+
         # New failure
-        self.failures.append(Failure(
+        failure = Failure(
             module_name=module_name,
             error_type=error_type,
             error_message=message,
             context=context or {},
-        ))
+        )
+        self.failures.append(failure)
+        self._failure_by_module[module_name] = failure
         self.metadata.total_failures += 1
-    
+
     def clear_failure(self, module_name: str) -> None:
         """Remove failures for a module (after successful fix)."""
-        self.failures = [f for f in self.failures if f.module_name != module_name]
+        if self._failure_by_module.pop(module_name, None) is not None:
+            self.failures = [f for f in self.failures if f.module_name != module_name]
     
     def add_blueprint(self, name: str, description: str, dependencies: Optional[List[str]] = None) -> OrganBlueprint:
         """Add or update a blueprint."""
@@ -295,9 +366,10 @@ class DNA:
             bp = self.blueprint[name]
             bp.description = description
             bp.version += 1
-            bp.updated_at = datetime.utcnow().isoformat() + "Z"
+            bp.updated_at = _now_iso()
             if dependencies:
                 bp.dependencies = dependencies
+                bp._compile_dependencies()
         else:
             # New blueprint
             bp = OrganBlueprint(
@@ -318,7 +390,11 @@ class DNA:
     
     def get_failed_modules(self) -> List[str]:
         """Get list of module names that have failures."""
-        return [f.module_name for f in self.failures]
+        return list(self._failure_by_module)
+
+    def has_failure(self, module_name: str) -> bool:
+        """Check whether a module has a recorded failure (O(1))."""
+        return module_name in self._failure_by_module
 
     def should_attempt(self, module_name: str, max_attempts: int = 3, cooldown_minutes: int = 30) -> bool:
         """
@@ -333,53 +409,50 @@ class DNA:
             max_attempts: Maximum attempts before circuit opens
             cooldown_minutes: Minutes to wait before retrying after circuit opens
         """
-        for failure in self.failures:
-            if failure.module_name == module_name:
-                if failure.circuit_open:
-                    # Check if cooldown has passed
-                    if failure.circuit_opened_at:
-                        opened_at = datetime.fromisoformat(failure.circuit_opened_at.rstrip('Z'))
-                        now = datetime.utcnow()
-                        elapsed = (now - opened_at).total_seconds() / 60
-                        if elapsed < cooldown_minutes:
-                            return False
-                        # Cooldown passed, close circuit and allow retry
-                        failure.circuit_open = False
-                        failure.circuit_opened_at = None
-                        return True
-                    return False
-                # Circuit not open, check attempt count
-                if failure.attempt_count >= max_attempts:
-                    # Too many attempts, open the circuit
-                    self.open_circuit(module_name)
+        failure = self._failure_by_module.get(module_name)
+        if failure is None:
+            # No failure record, safe to attempt
+            return True
+
+        if failure.circuit_open:
+            # Check if cooldown has passed
+            if failure.circuit_opened_at:
+                opened_at = datetime.fromisoformat(failure.circuit_opened_at.rstrip('Z'))
+                now = datetime.utcnow()
+                elapsed = (now - opened_at).total_seconds() / 60
+                if elapsed < cooldown_minutes:
                     return False
+                # Cooldown passed, close circuit and allow retry
+                failure.circuit_open = False
+                failure.circuit_opened_at = None
                 return True
-        # No failure record, safe to attempt
+            return False
+        # Circuit not open, check attempt count
+        if failure.attempt_count >= max_attempts:
+            # Too many attempts, open the circuit
+            self.open_circuit(module_name)
+            return False
         return True
 
     def open_circuit(self, module_name: str) -> None:
         """Open the circuit breaker for a module."""
-        for failure in self.failures:
-            if failure.module_name == module_name:
-                failure.circuit_open = True
-                failure.circuit_opened_at = datetime.utcnow().isoformat() + "Z"
-                return
+        failure = self._failure_by_module.get(module_name)
+        if failure is not None:
+            failure.circuit_open = True
+            failure.circuit_opened_at = _now_iso()
 
     def is_circuit_open(self, module_name: str) -> bool:
         """Check if circuit breaker is open for a module."""
-        for failure in self.failures:
-            if failure.module_name == module_name:
-                return failure.circuit_open
-        return False
+        failure = self._failure_by_module.get(module_name)
+        return failure.circuit_open if failure is not None else False
 
     def reset_circuit(self, module_name: str) -> None:
         """Manually reset the circuit breaker for a module."""
-        for failure in self.failures:
-            if failure.module_name == module_name:
-                failure.circuit_open = False
-                failure.circuit_opened_at = None
-                failure.attempt_count = 0
-                return
+        failure = self._failure_by_module.get(module_name)
+        if failure is not None:
+            failure.circuit_open = False
+            failure.circuit_opened_at = None
+            failure.attempt_count = 0
 
     def check_goal_satisfaction(self) -> int:
         """
@@ -425,7 +498,7 @@ class DNA:
             self.active_modules.append(module_name)
         self.metadata.total_evolutions += 1
         self.metadata.last_successful_organ = module_name
-        self.metadata.last_modified = datetime.utcnow().isoformat() + "Z"
+        self.metadata.last_modified = _now_iso()
     
     def mark_inactive(self, module_name: str) -> None:
         """Mark a module as inactive (failed)."""
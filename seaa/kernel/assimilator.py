@@ -89,6 +89,11 @@ class Assimilator:
     def get_running_organs(self) -> List[str]:
         """Get list of all running organ names."""
         return list(self.running_organs.keys())
+
+    @property
+    def running_count(self) -> int:
+        """Number of running organs, without snapshotting the name list."""
+        return len(self.running_organs)
     
     def integrate(self, module_name: str) -> bool:
         """
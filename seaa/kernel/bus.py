@@ -15,10 +15,13 @@ Features:
 """
 
 import asyncio
+import logging
+import sys
 import threading
 import queue
 import time
 import collections
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Callable, Any, Optional, List
 from uuid import uuid4
@@ -31,11 +34,11 @@ from seaa.core.config import config
 logger = get_logger("bus")
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     """
     A typed event for the nervous system.
-    
+
     All events have:
     - event_type: String identifier for routing
     - data: Optional payload
@@ -48,7 +51,18 @@ class Event:
     timestamp: str = field(default_factory=lambda: datetime.utcnow().isoformat() + "Z")
     source: str = "unknown"
     correlation_id: str = field(default_factory=lambda: str(uuid4())[:8])
-    
+
+    def __post_init__(self):
+        # The same few type strings recur across thousands of events;
+        # interning dedupes them and makes the dispatch-dict probe an
+        # identity comparison
+        self.event_type = sys.intern(self.event_type)
+
+    @property
+    def type(self) -> str:
+        """Alias for event_type - some bus dialects name the field this way."""
+        return self.event_type
+
     def __repr__(self):
         return f"<Event type={self.event_type} source={self.source} id={self.correlation_id}>"
     
@@ -97,31 +111,39 @@ class EventBus:
     _lock = threading.Lock()
     
     def __new__(cls):
-        if cls._instance is None:
+        # Fully initialize before publishing to cls._instance: another
+        # thread that reads the fast path must never see a bus whose
+        # attributes are still being assigned
+        instance = cls._instance
+        if instance is None:
             with cls._lock:
-                if cls._instance is None:
+                instance = cls._instance
+                if instance is None:
                     instance = super(EventBus, cls).__new__(cls)
-                    instance._initialized = False
+                    instance._init_state()
                     cls._instance = instance
-        return cls._instance
-    
-    def __init__(self):
-        if self._initialized:
-            return
+        return instance
 
+    def _init_state(self) -> None:
+        """One-time state setup, run under the singleton lock."""
         self._subscribers: dict[str, list[Callable[[Event], None]]] = {}
+        # Immutable per-type callback tuples, rebuilt on (un)subscribe.
+        # publish() reads this without taking the lock: dict reads are
+        # atomic under the GIL and tuples can't mutate mid-iteration.
+        self._dispatch: dict[str, tuple[Callable[[Event], None], ...]] = {}
         self._async_subscribers: dict[str, list[Callable[[Event], Any]]] = {}
         self._queue: queue.Queue = queue.Queue(maxsize=1000)  # Backpressure
         self._running = False
         self._worker_thread: Optional[threading.Thread] = None
         self._sub_lock = threading.RLock()
+        # Fan-out pool for publish_concurrent; threads spawn on first use
+        self._pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="bus")
 
         # Event retention (for debugging long-running systems)
         max_retained = getattr(config.event_bus, 'max_retained_events', 100)
         self._retained_events: collections.deque = collections.deque(maxlen=max_retained)
         self._retention_enabled = max_retained > 0
 
-        self._initialized = True
         logger.debug(f"EventBus initialized (retention: {max_retained} events)")
     
     def subscribe(
@@ -139,17 +161,20 @@ class EventBus:
         Returns:
             SubscriptionHandle that can be used to unsubscribe
         """
+        event_type = sys.intern(event_type)
         with self._sub_lock:
             if event_type not in self._subscribers:
                 self._subscribers[event_type] = []
             self._subscribers[event_type].append(callback)
-        
+            self._dispatch[event_type] = tuple(self._subscribers[event_type])
+
         logger.debug(f"Subscribed to '{event_type}' ({len(self._subscribers[event_type])} listeners)")
-        
+
         def unsubscribe():
             with self._sub_lock:
                 if event_type in self._subscribers and callback in self._subscribers[event_type]:
                     self._subscribers[event_type].remove(callback)
+                    self._dispatch[event_type] = tuple(self._subscribers[event_type])
                     logger.debug(f"Unsubscribed from '{event_type}'")
         
         return SubscriptionHandle(event_type, callback, unsubscribe)
@@ -165,14 +190,21 @@ class EventBus:
         if self._retention_enabled:
             self._retained_events.append(event)
 
-        with self._sub_lock:
-            listeners = list(self._subscribers.get(event.event_type, []))
+        # Lock-free read of the precomputed tuple - no per-publish copy
+        listeners = self._dispatch.get(event.event_type, ())
+
+        # Level-gated: never build the log strings on the hot path when
+        # DEBUG is off - on bursty publishers the formatting would cost
+        # more than the dispatch itself
+        debug = logger.isEnabledFor(logging.DEBUG)
 
         if not listeners:
-            logger.debug(f"No listeners for event: {event.event_type}")
+            if debug:
+                logger.debug(f"No listeners for event: {event.event_type}")
             return
 
-        logger.debug(f"Publishing: {event.event_type} -> {len(listeners)} listeners")
+        if debug:
+            logger.debug(f"Publishing: {event.event_type} -> {len(listeners)} listeners")
 
         for callback in listeners:
             try:
@@ -180,6 +212,28 @@ class EventBus:
             except Exception as e:
                 logger.error(f"Subscriber error for {event.event_type}: {e}")
     
+    def publish_concurrent(self, event: Event) -> None:
+        """
+        Publish an event with callbacks fanned out to a thread pool.
+
+        Returns as soon as the callbacks are submitted, so one slow
+        I/O-bound subscriber (e.g. a journal writing to disk) no longer
+        blocks the publisher or its sibling subscribers. Use publish()
+        when callbacks must run in order in the calling thread.
+        """
+        if self._retention_enabled:
+            self._retained_events.append(event)
+
+        for callback in self._dispatch.get(event.event_type, ()):
+            self._pool.submit(self._safe_call, callback, event)
+
+    @staticmethod
+    def _safe_call(callback: Callable[[Event], None], event: Event) -> None:
+        try:
+            callback(event)
+        except Exception as e:
+            logger.error(f"Subscriber error for {event.event_type}: {e}")
+
     def publish_async(self, event: Event) -> None:
         """
         Queue an event for async processing.
@@ -245,6 +299,16 @@ class EventBus:
             except Exception as e:
                 logger.error(f"Worker error: {e}")
     
+    def has_subscribers(self, event_type: str) -> bool:
+        """
+        Check if any subscriber is registered for an event type.
+
+        Lock-free fast path: dict reads are atomic under the GIL, and a
+        stale answer only affects one optional publish. Lets publishers
+        skip Event construction entirely when nobody is listening.
+        """
+        return bool(self._subscribers.get(event_type))
+
     def get_subscriber_count(self, event_type: Optional[str] = None) -> int:
         """Get number of subscribers for an event type (or total)."""
         with self._sub_lock:
@@ -291,8 +355,10 @@ class EventBus:
         with self._sub_lock:
             if event_type:
                 self._subscribers.pop(event_type, None)
+                self._dispatch.pop(event_type, None)
             else:
                 self._subscribers.clear()
+                self._dispatch.clear()
         logger.debug(f"Cleared subscribers: {event_type or 'all'}")
     
     @classmethod
@@ -303,6 +369,7 @@ class EventBus:
         with cls._lock:
             if cls._instance:
                 cls._instance.stop_worker(drain=False)
+                cls._instance._pool.shutdown(wait=False)
                 cls._instance = None
 
 
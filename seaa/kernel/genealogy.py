@@ -13,13 +13,25 @@ completely isolated from the project's main version control.
 
 import os
 import re
+import shlex
 import subprocess
+import threading
 from pathlib import Path
 from typing import List, Optional, Dict, Union
 
 from seaa.core.logging import get_logger
 from seaa.core.config import config
 
+# Optional fast path: libgit2 keeps index manipulation, tree writes and
+# commits in-process, avoiding the fork+exec cost (tens of ms per call)
+# the subprocess backend pays in the hot evolution loop.
+try:
+    import pygit2
+    HAS_PYGIT2 = True
+except ImportError:
+    HAS_PYGIT2 = False
+    pygit2 = None
+
 logger = get_logger("genealogy")
 
 # Security: Pattern for valid git config values
@@ -40,10 +52,39 @@ class Genealogy:
         """
         self.soma_path = Path(soma_path) if soma_path else config.paths.soma
         self.enabled = config.genealogy.enabled
-        
+
         # Ensure absolute path for safety
         self.soma_path = self.soma_path.resolve()
 
+        # Lazily-opened pygit2.Repository when libgit2 is available.
+        # The handle is this instance's long-lived git companion, so all
+        # repo operations are serialized: the metabolic loop and bus
+        # callbacks may hit genealogy concurrently, and even the
+        # subprocess backend would otherwise collide on git's index.lock
+        self._repo = None
+        self._git_lock = threading.Lock()
+
+    def _open_repo(self):
+        """Open (and cache) the libgit2 handle, or None without pygit2."""
+        if not HAS_PYGIT2:
+            return None
+        if self._repo is None:
+            try:
+                self._repo = pygit2.Repository(str(self.soma_path))
+            except Exception:
+                return None
+        return self._repo
+
+    def _signature(self):
+        """Author/committer signature from the validated git config."""
+        repo = self._repo
+        try:
+            return repo.default_signature
+        except Exception:
+            return pygit2.Signature(
+                config.genealogy.user_name, config.genealogy.user_email
+            )
+
     def _validate_config_value(self, value: str, field_name: str) -> str:
         """
         SECURITY: Validate git config values to prevent command injection.
@@ -130,20 +171,37 @@ class Genealogy:
             self.soma_path.mkdir(parents=True, exist_ok=True)
 
             logger.info("Initializing evolutionary memory (git)...")
-            self._run_git(["init"])
 
-            # Configure local user for this repo (with validated values)
-            self._run_git(["config", "user.name", user_name])
-            self._run_git(["config", "user.email", user_email])
-            
-            # create initial commit
             initial_file = self.soma_path / "README.md"
             if not initial_file.exists():
                 initial_file.write_text("# SOMA - Evolved Organs\n\nThis directory contains the evolved body of the AI.")
-            
-            self._run_git(["add", "."])
-            self._run_git(["commit", "-m", "Genesis: Initial Awakening"])
-            
+
+            if HAS_PYGIT2:
+                # In-process: init, config and the genesis commit with
+                # zero subprocess spawns
+                repo = pygit2.init_repository(str(self.soma_path))
+                repo.config["user.name"] = user_name
+                repo.config["user.email"] = user_email
+                self._repo = repo
+                repo.index.add_all()
+                repo.index.write()
+                tree = repo.index.write_tree()
+                sig = self._signature()
+                repo.create_commit("HEAD", sig, sig, "Genesis: Initial Awakening", tree, [])
+                return True
+
+            # One spawn instead of five: each subprocess costs far more
+            # in fork+exec than the git work itself, and this sequence
+            # sits on the critical awakening path. Values are validated
+            # above and shell-quoted regardless.
+            self._run_git_script(
+                "git init"
+                f" && git config user.name {shlex.quote(user_name)}"
+                f" && git config user.email {shlex.quote(user_email)}"
+                " && git add ."
+                " && git commit -m 'Genesis: Initial Awakening'"
+            )
+
             return True
         except Exception as e:
             logger.error(f"Failed to initialize genealogy: {e}")
@@ -165,20 +223,40 @@ class Genealogy:
             # SECURITY: Validate commit message
             safe_message = self._validate_commit_message(message)
 
-            # Check if there are changes
-            status = self._run_git(["status", "--porcelain"], capture_output=True)
-            if not status.strip():
+            with self._git_lock:
+                return self._commit_locked(safe_message)
+        except Exception as e:
+            logger.error(f"Failed to commit evolution: {e}")
+            return False
+
+    def _commit_locked(self, safe_message: str) -> bool:
+        """Commit body, run while holding the repo lock."""
+        repo = self._open_repo()
+        if repo is not None:
+            if not repo.status(untracked_files="all"):
                 # Nothing to commit
                 return False
-
-            self._run_git(["add", "."])
-            self._run_git(["commit", "-m", safe_message])
+            repo.index.add_all()
+            repo.index.write()
+            tree = repo.index.write_tree()
+            sig = self._signature()
+            repo.create_commit(
+                "HEAD", sig, sig, safe_message, tree, [repo.head.target]
+            )
             logger.info(f"Evolution captured: {safe_message}")
             return True
-        except Exception as e:
-            logger.error(f"Failed to commit evolution: {e}")
+
+        # Check if there are changes
+        status = self._run_git(["status", "--porcelain"], capture_output=True)
+        if not status.strip():
+            # Nothing to commit
             return False
 
+        self._run_git(["add", "."])
+        self._run_git(["commit", "-m", safe_message])
+        logger.info(f"Evolution captured: {safe_message}")
+        return True
+
     def revert_last(self) -> bool:
         """
         Revert to the previous state (HEAD^).
@@ -189,8 +267,14 @@ class Genealogy:
             
         try:
             logger.warning("REVERTING to previous evolutionary state...")
-            self._run_git(["reset", "--hard", "HEAD^"])
-            return True
+            with self._git_lock:
+                repo = self._open_repo()
+                if repo is not None:
+                    parent = repo.head.peel(pygit2.Commit).parents[0]
+                    repo.reset(parent.id, pygit2.GIT_RESET_HARD)
+                    return True
+                self._run_git(["reset", "--hard", "HEAD^"])
+                return True
         except Exception as e:
             logger.error(f"Failed to revert: {e}")
             return False
@@ -211,10 +295,33 @@ class Genealogy:
             generations = 1
 
         try:
-            return self._run_git(["diff", f"HEAD~{generations}", "HEAD"], capture_output=True)
+            with self._git_lock:
+                repo = self._open_repo()
+                if repo is not None:
+                    old = repo.revparse_single(f"HEAD~{generations}")
+                    new = repo.revparse_single("HEAD")
+                    return repo.diff(old, new).patch or ""
+                return self._run_git(["diff", f"HEAD~{generations}", "HEAD"], capture_output=True)
         except Exception:
             return ""
 
+    def _run_git_script(self, script: str) -> None:
+        """
+        Run several git commands as one `sh -c` invocation.
+
+        Collapses a fixed sequence into a single fork+exec. Only for
+        command strings built from validated, shell-quoted values; use
+        _run_git when structured output is needed.
+        """
+        subprocess.run(
+            script,
+            shell=True,
+            cwd=self.soma_path,
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+
     def _run_git(self, args: List[str], capture_output: bool = False) -> str:
         """
         Execute a git command within the soma directory.
@@ -16,7 +16,9 @@ import os
 import sys
 import signal
 import threading
-import time
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
 from pathlib import Path
 from typing import Callable, Optional, Union
 
@@ -33,12 +35,16 @@ from seaa.kernel.bus import bus, Event
 from seaa.kernel.assimilator import Assimilator
 from seaa.kernel.materializer import Materializer
 from seaa.kernel.immunity import Immunity
-from seaa.connectors.llm_gateway import ProviderGateway
 from seaa.cortex.architect import Architect
 from seaa.kernel.genealogy import Genealogy
 
 logger = get_logger("genesis")
 
+# Main-thread identity never changes for the life of the process;
+# capture it once at import instead of calling threading.main_thread()
+# on every Genesis construction
+_MAIN_THREAD = threading.main_thread()
+
 
 class Genesis:
     """
@@ -98,8 +104,13 @@ class Genesis:
             genealogy=self.genealogy,
         )
         
-        # Initialize LLM gateway
-        self.gateway = ProviderGateway()
+        # Initialize LLM gateway (shared process-wide instance so the
+        # connection pool and response cache are reused). Imported here
+        # rather than at module level: importing seaa.kernel should not
+        # pay for the HTTP stack and cache setup unless an orchestrator
+        # is actually constructed.
+        from seaa.connectors.llm_gateway import get_gateway
+        self.gateway = get_gateway()
         
         # Initialize Architect
         self.architect = Architect(
@@ -108,12 +119,42 @@ class Genesis:
             save_callback=self._save_dna,
         )
         
-        # Lifecycle state
+        # Lifecycle state: a stop event drives shutdown, a wake event lets
+        # other threads trigger an immediate metabolic cycle (see poke()).
+        # _running stays as the public-ish flag, backed by the stop event.
+        self._stop = threading.Event()
+        self._wake = threading.Event()
         self._running = False
         self._setup_signal_handlers()
         
         logger.info(f"Genesis initialized: {self.dna.system_name} v{self.dna.system_version}")
-    
+
+    @property
+    def _running(self) -> bool:
+        return not self._stop.is_set()
+
+    @_running.setter
+    def _running(self, value: bool) -> None:
+        if value:
+            self._stop.clear()
+            self._wake.clear()
+        else:
+            # Wake the life loop immediately so shutdown doesn't wait
+            # out the remainder of the cycle interval
+            self._stop.set()
+            self._wake.set()
+
+    def poke(self) -> None:
+        """
+        Trigger an immediate metabolic cycle.
+
+        Callers (e.g. a CLI pushing a new blueprint) can use this to make
+        the life loop reflect now rather than waiting up to
+        cycle_interval_seconds.
+        """
+        self._wake.set()
+
+
     def _setup_signal_handlers(self) -> None:
         """Setup graceful shutdown handlers.
 
@@ -122,7 +163,7 @@ class Genesis:
         we skip signal registration - shutdown is handled by the runtime.
         """
         # Signal handlers can only be set from main thread
-        if threading.current_thread() is not threading.main_thread():
+        if threading.current_thread() is not _MAIN_THREAD:
             logger.debug("Running in background thread, skipping signal handlers")
             return
 
@@ -193,9 +234,7 @@ class Genesis:
                 logger.warning(f"Waiting for dependencies: {list(pending.keys())}")
                 break
 
-            for organ_name, blueprint in organs_this_cycle:
-                if self._evolve_organ(organ_name, blueprint):
-                    evolved_count += 1
+            evolved_count += self._evolve_batch(organs_this_cycle)
 
         return evolved_count
     
@@ -219,12 +258,11 @@ class Genesis:
                 buildable.append((organ_name, blueprint))
                 continue
 
-            # Check each dependency
+            # Check each dependency (patterns precompiled at blueprint creation)
             all_satisfied = True
-            for dep in blueprint.dependencies:
+            for dep, is_wildcard, pattern in blueprint.compiled_dependencies:
                 # Support wildcard patterns (e.g., "soma.perception.*")
-                if "*" in dep:
-                    pattern = dep.replace("*", "")
+                if is_wildcard:
                     satisfied = any(mod.startswith(pattern) for mod in active_modules)
                 else:
                     satisfied = dep in active_modules
@@ -239,16 +277,15 @@ class Genesis:
 
         return buildable
 
-    def _evolve_organ(self, organ_name: str, blueprint: OrganBlueprint) -> bool:
+    def _can_evolve(self, organ_name: str) -> bool:
         """
-        Generate and materialize a single organ.
+        Check circuit breaker and resource limits before evolving an organ.
 
         Args:
             organ_name: Fully qualified module name
-            blueprint: The organ blueprint
 
         Returns:
-            True if successful
+            True if evolution should be attempted
         """
         # Circuit breaker check
         if not self.dna.should_attempt(
@@ -264,8 +301,24 @@ class Genesis:
             logger.warning(f"Max total organs ({config.metabolism.max_total_organs}) reached, skipping {organ_name}")
             return False
 
+        return True
+
+    def _evolve_organ(self, organ_name: str, blueprint: OrganBlueprint) -> bool:
+        """
+        Generate and materialize a single organ.
+
+        Args:
+            organ_name: Fully qualified module name
+            blueprint: The organ blueprint
+
+        Returns:
+            True if successful
+        """
+        if not self._can_evolve(organ_name):
+            return False
+
         logger.info(f"Evolving: {organ_name}")
-        
+
         try:
             # Generate code via LLM (pass active modules for context)
             code = self.gateway.generate_code(
@@ -273,41 +326,118 @@ class Genesis:
                 blueprint.description,
                 active_modules=self.dna.active_modules,
             )
-            
-            if not code:
-                logger.error(f"Failed to generate code for {organ_name}")
-                self.dna.add_failure(
+        except Exception as e:
+            logger.error(f"Code generation failed for {organ_name}: {e}")
+            self.dna.add_failure(organ_name, FailureType.GENERATION, str(e))
+            self._save_dna()
+            return False
+
+        return self._finalize_evolution(organ_name, code)
+
+    def _evolve_batch(self, organs: list) -> int:
+        """
+        Generate and materialize a batch of organs.
+
+        Code generation is dominated by network-bound LLM latency, so
+        generations run concurrently on a thread pool. Materialization,
+        DNA updates and genealogy commits touch shared state and are
+        serialized on the Genesis thread as each generation completes.
+
+        Args:
+            organs: List of (organ_name, blueprint) tuples
+
+        Returns:
+            Number of organs successfully evolved
+        """
+        organs = [(name, bp) for name, bp in organs if self._can_evolve(name)]
+
+        if not organs:
+            return 0
+
+        # Single organ: no pool overhead needed
+        if len(organs) == 1:
+            return 1 if self._evolve_organ(*organs[0]) else 0
+
+        max_workers = min(len(organs), config.metabolism.max_concurrent_generations)
+        logger.info(f"Evolving {len(organs)} organs ({max_workers} concurrent generations)")
+
+        evolved = 0
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="organ-gen") as pool:
+            futures = {
+                pool.submit(
+                    self.gateway.generate_code,
                     organ_name,
-                    FailureType.GENERATION,
-                    "LLM failed to generate code"
-                )
-                self._save_dna()
-                return False
-            
+                    blueprint.description,
+                    active_modules=self.dna.active_modules,
+                ): organ_name
+                for organ_name, blueprint in organs
+            }
+
+            for future in as_completed(futures):
+                organ_name = futures[future]
+                try:
+                    code = future.result()
+                except Exception as e:
+                    logger.error(f"Code generation failed for {organ_name}: {e}")
+                    self.dna.add_failure(organ_name, FailureType.GENERATION, str(e))
+                    self._save_dna()
+                    continue
+
+                if self._finalize_evolution(organ_name, code):
+                    evolved += 1
+
+        return evolved
+
+    def _finalize_evolution(self, organ_name: str, code: Optional[str]) -> bool:
+        """
+        Materialize generated code and update DNA state.
+
+        Must run on the Genesis thread - touches DNA, the filesystem
+        and the genealogy repo.
+
+        Args:
+            organ_name: Fully qualified module name
+            code: Generated source code (may be empty on LLM failure)
+
+        Returns:
+            True if successful
+        """
+        if not code:
+            logger.error(f"Failed to generate code for {organ_name}")
+            self.dna.add_failure(
+                organ_name,
+                FailureType.GENERATION,
+                "LLM failed to generate code"
+            )
+            self._save_dna()
+            return False
+
+        try:
             # Materialize to filesystem
             self.materializer.materialize(organ_name, code)
-            
+
             # Mark as active in DNA
             self.dna.mark_active(organ_name)
-            
+
             # Clear any previous failures
             self.dna.clear_failure(organ_name)
-            
+
             self._save_dna()
             logger.info(f"✓ Evolved: {organ_name}")
-            
-            # Emit event
-            bus.publish(Event(
-                event_type="organ.evolved",
-                data={"organ": organ_name},
-                source="genesis",
-            ))
+
+            # Emit event (skip construction when nobody is listening)
+            if bus.has_subscribers("organ.evolved"):
+                bus.publish(Event(
+                    event_type="organ.evolved",
+                    data={"organ": organ_name},
+                    source="genesis",
+                ))
 
             # Commit the evolution to memory
             self.genealogy.commit(f"Evolved: {organ_name}")
-            
+
             return True
-            
+
         except Exception as e:
             logger.error(f"Evolution failed for {organ_name}: {e}")
             self.dna.add_failure(
@@ -326,9 +456,11 @@ class Genesis:
             Number successfully integrated
         """
         active = self.dna.active_modules
-        already_running = self.assimilator.get_running_organs()
+        already_running = set(self.assimilator.get_running_organs())
 
-        to_integrate = [m for m in active if m not in already_running]
+        # Set difference is O(N+M) vs O(N*M) for list membership;
+        # sort for deterministic integration order
+        to_integrate = sorted(set(active) - already_running)
 
         if not to_integrate:
             logger.info("No new organs to integrate")
@@ -356,12 +488,13 @@ class Genesis:
                 if self.assimilator.integrate(module_name):
                     success_count += 1
                     
-                    # Emit event
-                    bus.publish(Event(
-                        event_type="organ.integrated",
-                        data={"organ": module_name},
-                        source="genesis",
-                    ))
+                    # Emit event (skip construction when nobody is listening)
+                    if bus.has_subscribers("organ.integrated"):
+                        bus.publish(Event(
+                            event_type="organ.integrated",
+                            data={"organ": module_name},
+                            source="genesis",
+                        ))
                     
             except ImportFailedError as e:
                 # Try to heal the import issue
@@ -389,8 +522,11 @@ class Genesis:
         
         try:
             while self._running:
-                time.sleep(interval)
-                
+                # Event.wait instead of time.sleep: returns early on
+                # shutdown or poke() rather than sleeping out the interval
+                self._wake.wait(interval)
+                self._wake.clear()
+
                 if not self._running:
                     break
                 
@@ -403,7 +539,8 @@ class Genesis:
                 
                 if pending:
                     logger.info(f"New needs: {list(pending.keys())}")
-                    for organ_name, blueprint in list(pending.items())[:config.metabolism.max_organs_per_cycle]:
+                    # islice avoids materializing the full items list just to take K
+                    for organ_name, blueprint in islice(pending.items(), config.metabolism.max_organs_per_cycle):
                         if self._evolve_organ(organ_name, blueprint):
                             # Integrate immediately
                             try:
@@ -411,16 +548,20 @@ class Genesis:
                             except AssimilationError:
                                 pass
                 
-                # Emit heartbeat
-                bus.publish(Event(
-                    event_type="system.heartbeat",
-                    data={
-                        "running_organs": len(self.assimilator.get_running_organs()),
-                        "pending_blueprints": len(pending),
-                        "failures": len(self.dna.failures),
-                    },
-                    source="genesis",
-                ))
+                # Emit heartbeat (skip construction when nobody is listening)
+                if bus.has_subscribers("system.heartbeat"):
+                    # Fresh dict per publish: the bus retains events and
+                    # stream consumers queue them, so a reused payload
+                    # would be rewritten under them on the next cycle
+                    bus.publish(Event(
+                        event_type="system.heartbeat",
+                        data={
+                            "running_organs": self.assimilator.running_count,
+                            "pending_blueprints": len(pending),
+                            "failures": len(self.dna.failures),
+                        },
+                        source="genesis",
+                    ))
                 
         except Exception as e:
             logger.error(f"Fatal error in life loop: {e}")
@@ -463,12 +604,13 @@ class Genesis:
         self.dna.mark_inactive(module_name)
         self._save_dna()
         
-        # Emit event
-        bus.publish(Event(
-            event_type="organ.failed",
-            data={"organ": module_name, "error": error_message},
-            source="genesis",
-        ))
+        # Emit event (skip construction when nobody is listening)
+        if bus.has_subscribers("organ.failed"):
+            bus.publish(Event(
+                event_type="organ.failed",
+                data={"organ": module_name, "error": error_message},
+                source="genesis",
+            ))
         
         # Auto-Immune Response:
         # If this failure is happening to a freshly evolved organ, 
@@ -18,11 +18,12 @@ This enables:
 
 import json
 import hashlib
+import os
 import threading
-from dataclasses import dataclass, asdict
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional, Union
+from typing import Dict, Optional, Union
 from uuid import uuid4
 
 from seaa.core.logging import get_logger
@@ -52,7 +53,15 @@ class InstanceIdentity:
     parent_id: Optional[str] = None  # If spawned from another instance
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        # Flat dataclass of plain strings - a dict literal skips the
+        # recursive deep-copy that asdict() performs
+        return {
+            "id": self.id,
+            "name": self.name,
+            "genesis_time": self.genesis_time,
+            "lineage": self.lineage,
+            "parent_id": self.parent_id,
+        }
 
     @classmethod
     def from_dict(cls, data: dict) -> "InstanceIdentity":
@@ -78,31 +87,18 @@ class IdentityManager:
     genealogy tracking.
     """
 
-    _instance: Optional["IdentityManager"] = None
-    _lock = threading.Lock()
-
-    def __new__(cls, *args, **kwargs):
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-                    cls._instance._initialized = False
-        return cls._instance
-
     def __init__(
         self,
         identity_path: Union[Path, str] = DEFAULT_IDENTITY_PATH,
         dna_path: Union[Path, str] = "dna.json",
     ):
-        if self._initialized:
-            return
-
         self._identity_path = Path(identity_path)
         self._dna_path = Path(dna_path)
         self._identity: Optional[InstanceIdentity] = None
         self._file_lock = threading.RLock()
+        # (st_mtime_ns, st_size, hash) - avoids re-hashing an unchanged DNA file
+        self._lineage_cache: Optional[tuple] = None
 
-        self._initialized = True
         logger.debug(f"IdentityManager initialized: {self._identity_path}")
 
     def _compute_lineage(self) -> str:
@@ -113,8 +109,15 @@ class IdentityManager:
         """
         try:
             if self._dna_path.exists():
+                stat = self._dna_path.stat()
+                cache_key = (stat.st_mtime_ns, stat.st_size)
+                if self._lineage_cache and self._lineage_cache[:2] == cache_key:
+                    return self._lineage_cache[2]
+
                 content = self._dna_path.read_bytes()
-                return hashlib.sha256(content).hexdigest()[:16]
+                lineage = hashlib.sha256(content).hexdigest()[:16]
+                self._lineage_cache = cache_key + (lineage,)
+                return lineage
             return "tabula-rasa"
         except Exception as e:
             logger.warning(f"Failed to compute lineage: {e}")
@@ -122,13 +125,17 @@ class IdentityManager:
 
     def _create_identity(self, name: Optional[str] = None) -> InstanceIdentity:
         """Create a new identity for this instance."""
-        instance_id = str(uuid4())
+        # .hex skips UUID.__str__'s hyphen formatting - the raw 32-char
+        # value is all we need for IDs and short_id() slicing
+        instance_id = uuid4().hex
         default_name = f"SEAA-{instance_id[:8]}"
 
         identity = InstanceIdentity(
             id=instance_id,
             name=name or default_name,
-            genesis_time=datetime.utcnow().isoformat() + "Z",
+            # datetime.utcnow() is deprecated in 3.12; the aware variant
+            # also avoids the manual "Z" concat
+            genesis_time=datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z"),
             lineage=self._compute_lineage(),
         )
 
@@ -158,7 +165,12 @@ class IdentityManager:
 
         try:
             with open(temp_path, "w") as f:
-                json.dump(identity.to_dict(), f, indent=2)
+                # Compact by default - the file is machine-read; set
+                # SEAA_PRETTY_JSON for human-friendly formatting in dev
+                if os.environ.get("SEAA_PRETTY_JSON"):
+                    json.dump(identity.to_dict(), f, indent=2)
+                else:
+                    json.dump(identity.to_dict(), f, separators=(",", ":"))
             temp_path.rename(self._identity_path)
             logger.debug(f"Saved identity: {identity.short_id()}")
         except Exception as e:
@@ -234,16 +246,19 @@ class IdentityManager:
 
     @classmethod
     def reset_instance(cls) -> None:
-        """Reset singleton (for testing only)."""
-        with cls._lock:
-            if cls._instance:
-                cls._instance._identity = None
-                cls._instance._initialized = False
-                cls._instance = None
+        """Reset cached manager instances (for testing only)."""
+        with _manager_lock:
+            _managers.clear()
 
 
-# Convenience: Module-level singleton access
-_manager: Optional[IdentityManager] = None
+# Convenience: Module-level cached access, keyed by path.
+#
+# IdentityManager itself is a plain class now - constructing it directly
+# always yields a fresh instance with exactly the paths you asked for.
+# The shared-instance guarantee lives here, where it belongs: callers
+# using different paths get different managers instead of silently
+# receiving the first one's config.
+_managers: Dict[tuple, IdentityManager] = {}
 _manager_lock = threading.Lock()
 
 
@@ -251,13 +266,16 @@ def get_identity_manager(
     identity_path: Union[Path, str] = DEFAULT_IDENTITY_PATH,
     dna_path: Union[Path, str] = "dna.json",
 ) -> IdentityManager:
-    """Get or create the identity manager singleton (thread-safe)."""
-    global _manager
-    if _manager is None:
+    """Get or create the identity manager for these paths (thread-safe)."""
+    key = (str(identity_path), str(dna_path))
+    manager = _managers.get(key)
+    if manager is None:
         with _manager_lock:
-            if _manager is None:  # Double-check locking
-                _manager = IdentityManager(identity_path, dna_path)
-    return _manager
+            manager = _managers.get(key)
+            if manager is None:  # Double-check locking
+                manager = IdentityManager(identity_path, dna_path)
+                _managers[key] = manager
+    return manager
 
 
 def get_identity() -> InstanceIdentity:
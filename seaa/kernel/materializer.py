@@ -10,6 +10,7 @@ Single Responsibility:
 - Kernel protection enforcement
 """
 
+import functools
 import os
 import re
 from pathlib import Path
@@ -24,11 +25,26 @@ from seaa.core.exceptions import (
 )
 
 # Security: Strict module name pattern - only valid Python identifiers under soma.*
-MODULE_NAME_PATTERN = re.compile(r'^soma(\.[a-z_][a-z0-9_]*)+$', re.IGNORECASE)
+# re.ASCII keeps the character classes off the Unicode category tables;
+# case-sensitive on purpose since Python identifiers are case-sensitive
+MODULE_NAME_PATTERN = re.compile(r'^soma(\.[a-z_][a-z0-9_]*)+$', re.ASCII)
 
 logger = get_logger("materializer")
 
 
+@functools.lru_cache(maxsize=4096)
+def _module_to_path_cached(root_str: str, module_name: str) -> str:
+    """
+    Translate a validated module name to its absolute path string.
+
+    Module-level and keyed on (root, name) so repeated lookups of the
+    same organ (integrator retries, exists/read loops) skip the split
+    and per-component Path allocation entirely.
+    """
+    parts = module_name.split(".")
+    return os.path.join(root_str, *parts[:-1], parts[-1] + ".py")
+
+
 class Materializer:
     """
     The Materializer writes generated organ code to the filesystem.
@@ -46,6 +62,12 @@ class Materializer:
         """
         self.root_dir = Path(root_dir) if root_dir else config.paths.root
         self.protected_prefixes = list(config.security.protected_prefixes)
+        # The root never moves after construction; resolving it per call
+        # costs an lstat per path component
+        self._resolved_root = self.root_dir.resolve()
+        # Directories whose __init__.py chain has already been ensured
+        # this process - saves the O(depth) stat walk per materialize
+        self._ensured_packages: set = set()
     
     def materialize(self, module_name: str, code: str) -> Path:
         """
@@ -77,8 +99,8 @@ class Materializer:
                 context={"module": module_name}
             )
 
-        # Step 4: Convert to path (includes path traversal check)
-        file_path = self._module_to_path(module_name)
+        # Step 4: Convert to path (name already validated in step 1)
+        file_path = self._module_to_path_unchecked(module_name)
 
         # Step 5: Create directory structure
         self._ensure_package_structure(file_path.parent)
@@ -104,13 +126,16 @@ class Materializer:
         Raises:
             MaterializationError: If module name is invalid or malicious
         """
-        if not module_name or not isinstance(module_name, str):
+        if not isinstance(module_name, str):
             raise MaterializationError(
-                "Invalid module name: must be non-empty string",
+                "Invalid module name: must be a string",
                 context={"module": str(module_name)}
             )
 
         # Check against strict pattern: soma.valid_identifier.valid_identifier...
+        # The regex is authoritative - it enforces the identifier rule per
+        # part and rejects empty strings and empty components, so the old
+        # separate "" and ".." checks were dead code.
         if not MODULE_NAME_PATTERN.match(module_name):
             raise MaterializationError(
                 f"Invalid module name format: '{module_name}'. "
@@ -119,24 +144,6 @@ class Materializer:
                 context={"module": module_name, "pattern": MODULE_NAME_PATTERN.pattern}
             )
 
-        # Additional check: no consecutive dots (path traversal attempt)
-        if ".." in module_name:
-            raise MaterializationError(
-                f"Path traversal detected in module name: '{module_name}'",
-                context={"module": module_name}
-            )
-
-        # Check each part is a valid Python identifier
-        parts = module_name.split(".")
-        for part in parts:
-            if not part or not part.replace("_", "").replace("0", "").replace("1", "").replace("2", "").replace("3", "").replace("4", "").replace("5", "").replace("6", "").replace("7", "").replace("8", "").replace("9", "").isalpha():
-                # More thorough check using Python's own validation
-                if not part.isidentifier():
-                    raise MaterializationError(
-                        f"Invalid identifier '{part}' in module name: '{module_name}'",
-                        context={"module": module_name, "invalid_part": part}
-                    )
-
     def _module_to_path(self, module_name: str) -> Path:
         """
         Convert module name to file path.
@@ -151,20 +158,21 @@ class Materializer:
         # Step 1: Validate module name format
         self._validate_module_name(module_name)
 
-        parts = module_name.split(".")
-        # parts = ['soma', 'perception', 'observer']
+        return self._module_to_path_unchecked(module_name)
 
-        # Build path: root / soma / perception / observer.py
-        path = self.root_dir
-        for part in parts[:-1]:  # All but last
-            path = path / part
+    def _module_to_path_unchecked(self, module_name: str) -> Path:
+        """
+        Convert an already-validated module name to a file path.
 
-        file_name = parts[-1] + ".py"
-        final_path = path / file_name
+        Callers that have just run _validate_module_name (e.g. materialize)
+        use this to avoid paying for validation twice.
+        """
+        # e.g. 'soma.perception.observer' -> root/soma/perception/observer.py
+        final_path = Path(_module_to_path_cached(str(self.root_dir), module_name))
 
         # SECURITY: Resolve to absolute path and verify it's under root_dir
         resolved_path = final_path.resolve()
-        resolved_root = self.root_dir.resolve()
+        resolved_root = self._resolved_root
 
         # Ensure the resolved path starts with the root directory
         try:
@@ -185,36 +193,88 @@ class Materializer:
         """
         Create directory and all parent __init__.py files.
         """
-        # Create directory
-        directory.mkdir(parents=True, exist_ok=True)
-        
-        # Walk up from the directory, creating __init__.py in each
-        # Stop at root_dir or when we hit an existing __init__.py chain
+        if directory in self._ensured_packages:
+            return
+
+        # Single upward pass collecting directories not yet ensured,
+        # instead of mkdir(parents=True) walking the tree once and the
+        # __init__.py loop stat-ing it a second time
+        stop = self.root_dir.parent
+        pending = []
         current = directory
-        while current != self.root_dir.parent:
-            init_file = current / "__init__.py"
-            if not init_file.exists():
-                init_file.write_text(f"# SEAA auto-generated package: {current.name}\n")
-                logger.debug(f"Created package: {init_file}")
+        while current != stop and current not in self._ensured_packages:
+            pending.append(current)
             current = current.parent
-            if current == self.root_dir.parent:
-                break
+
+        # Create root-first; O_EXCL makes "already has an __init__.py"
+        # a cheap EEXIST instead of a stat + reopen
+        for pkg_dir in reversed(pending):
+            try:
+                os.mkdir(pkg_dir)
+            except FileExistsError:
+                pass
+
+            init_file = pkg_dir / "__init__.py"
+            try:
+                fd = os.open(init_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+            except FileExistsError:
+                pass
+            else:
+                try:
+                    os.write(fd, f"# SEAA auto-generated package: {pkg_dir.name}\n".encode("utf-8"))
+                finally:
+                    os.close(fd)
+                logger.debug(f"Created package: {init_file}")
+
+            self._ensured_packages.add(pkg_dir)
     
     def _atomic_write(self, path: Path, content: str) -> None:
         """
         Write file atomically (write to temp, then rename).
-        
-        This prevents partial writes from corrupting files.
+
+        This prevents partial writes from corrupting files. With
+        config.durable_writes (the default), the canonical
+        write -> fsync(fd) -> rename -> fsync(parent dir) sequence is
+        followed so a crash can't leave a zero-length file behind
+        (delayed allocation on ext4 can journal the rename before the
+        data blocks land).
         """
         # Write to temp file in same directory (for same-filesystem atomic rename)
         temp_path = path.with_suffix(".tmp")
         try:
-            with open(temp_path, "w") as f:
-                f.write(content)
-            
-            # Atomic rename
-            temp_path.rename(path)
-            
+            # Encode once and write raw bytes - avoids the TextIOWrapper
+            # encoder and usually lands in a single write(2) syscall
+            data = memoryview(content.encode("utf-8"))
+            fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                while data:
+                    written = os.write(fd, data)
+                    data = data[written:]
+                if config.durable_writes:
+                    os.fsync(fd)
+            finally:
+                os.close(fd)
+
+            # Atomic rename - replace() maps to os.replace, which also
+            # overwrites an existing destination on Windows instead of
+            # raising (rename would force a non-atomic delete-then-rename)
+            temp_path.replace(path)
+
+            if config.durable_writes:
+                # Persist the rename itself - the new directory entry
+                # isn't durable until the parent directory is synced.
+                # Best-effort: Windows can't open directories this way,
+                # and the rename above has already succeeded, so a
+                # failure here must not fail the materialization
+                try:
+                    dir_fd = os.open(path.parent, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+                    try:
+                        os.fsync(dir_fd)
+                    finally:
+                        os.close(dir_fd)
+                except OSError:
+                    pass
+
         except Exception as e:
             # Clean up temp file on failure
             if temp_path.exists():
@@ -279,16 +339,20 @@ class Materializer:
         soma_dir = self.root_dir / "soma"
         if not soma_dir.exists():
             return []
-        
+
+        # Iterative os.scandir walk: the dirent already knows file/dir on
+        # Linux, so this avoids the per-entry stat and Path allocation
+        # that rglob pays on large trees
+        root_prefix = len(str(self.root_dir)) + 1
         organs = []
-        for py_file in soma_dir.rglob("*.py"):
-            if py_file.name == "__init__.py":
-                continue
-            
-            # Convert path back to module name
-            relative = py_file.relative_to(self.root_dir)
-            # PosixPath('soma/perception/observer.py') -> 'soma.perception.observer'
-            module_name = str(relative.with_suffix("")).replace(os.sep, ".")
-            organs.append(module_name)
-        
+        stack = [str(soma_dir)]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(".py") and entry.name != "__init__.py":
+                        # 'root/soma/perception/observer.py' -> 'soma.perception.observer'
+                        organs.append(entry.path[root_prefix:-3].replace(os.sep, "."))
+
         return organs
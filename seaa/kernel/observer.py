@@ -11,6 +11,8 @@ The Observer wraps Beacon and adds local-only capabilities.
 This is what CLI commands and local evolved interfaces use.
 """
 
+import heapq
+import os
 import queue
 import threading
 from datetime import datetime
@@ -33,6 +35,9 @@ from seaa.kernel.protocols import (
 
 logger = get_logger("observer")
 
+# Pushed onto a stream's queue to unblock and terminate it
+_STREAM_SENTINEL = object()
+
 
 class Observer(LocalObservable):
     """
@@ -55,9 +60,26 @@ class Observer(LocalObservable):
         self._beacon = Beacon(dna_path, start_time)
         self._repo = DNARepository(dna_path, verify_integrity=False)
         self._dna_path = Path(dna_path)
+        # (st_mtime_ns, DNA) - dashboards call several observer methods
+        # per tick; reuse one parse while the file is unchanged
+        self._dna_cache: Optional[tuple] = None
+        # Queues of active stream_events() consumers, so stop_streams()
+        # can push the sentinel and unblock them
+        self._stream_queues: List[queue.Queue] = []
 
         logger.debug("Observer initialized")
 
+    def _load_dna_cached(self) -> DNA:
+        """Load DNA, reusing the parsed copy while the file's mtime holds."""
+        stat = os.stat(self._dna_path)
+        cache = self._dna_cache
+        if cache is not None and cache[0] == stat.st_mtime_ns:
+            return cache[1]
+
+        dna = self._repo.load()
+        self._dna_cache = (stat.st_mtime_ns, dna)
+        return dna
+
     # =========================================
     # Observable Protocol (delegated to Beacon)
     # =========================================
@@ -93,7 +115,10 @@ class Observer(LocalObservable):
             for event in observer.stream_events():
                 print(event)
         """
-        event_queue: queue.Queue = queue.Queue()
+        # Bounded: a slow consumer drops events instead of pinning the
+        # whole backlog in memory
+        event_queue: queue.Queue = queue.Queue(maxsize=4096)
+        dropped = [0]  # mutable so the handlers can count drops
         handles: List[SubscriptionHandle] = []
 
         # Default: subscribe to key system events
@@ -104,31 +129,53 @@ class Observer(LocalObservable):
                 "system.heartbeat",
             ]
 
-        def make_handler(pattern: str):
-            """Create handler that queues matching events."""
-            def handler(event: Event):
-                event_queue.put(event)
-            return handler
+        # One shared handler for every pattern - the old per-pattern
+        # factory closure captured the pattern without ever using it
+        def queue_event(event: Event) -> None:
+            try:
+                event_queue.put_nowait(event)
+            except queue.Full:
+                dropped[0] += 1
+                if dropped[0] % 1000 == 1:
+                    logger.warning(f"Event stream backlogged, dropped {dropped[0]} events")
 
         # Subscribe to each pattern
         for pattern in patterns:
-            handle = bus.subscribe(pattern, make_handler(pattern))
-            handles.append(handle)
+            handles.append(bus.subscribe(pattern, queue_event))
             logger.debug(f"Streaming events: {pattern}")
 
+        self._stream_queues.append(event_queue)
         try:
             while True:
-                try:
-                    event = event_queue.get(timeout=1.0)
-                    yield event
-                except queue.Empty:
-                    continue
+                # Blocking get: zero idle wake-ups, events delivered on put.
+                # The 1s-timeout poll this replaces burned CPU at 1 Hz
+                # without actually enabling cross-thread shutdown.
+                event = event_queue.get()
+                if event is _STREAM_SENTINEL:
+                    break
+                yield event
         finally:
-            # Cleanup subscriptions
+            # Cleanup subscriptions (runs on generator close/GC)
+            if event_queue in self._stream_queues:
+                self._stream_queues.remove(event_queue)
             for handle in handles:
                 handle.unsubscribe()
             logger.debug("Stopped event stream")
 
+    def stop_streams(self) -> None:
+        """
+        Terminate every active stream_events() consumer.
+
+        Pushes the sentinel onto each stream's queue so generators
+        blocked in a queue get() wake up, break out and run their
+        cleanup. Safe to call from any thread.
+        """
+        for event_queue in list(self._stream_queues):
+            # Blocking put: if the queue is full the consumer is still
+            # draining, so space frees up; put_nowait could silently
+            # drop the sentinel and leave the stream running
+            event_queue.put(_STREAM_SENTINEL)
+
     def get_timeline(self, limit: int = 20) -> List[Dict[str, Any]]:
         """
         Get recent evolution timeline.
@@ -137,45 +184,61 @@ class Observer(LocalObservable):
         Returns most recent events first.
         """
         try:
-            dna = self._repo.load()
+            dna = self._load_dna_cached()
         except Exception:
             return []
 
-        events: List[Dict[str, Any]] = []
+        # Most recent first; nlargest is O(N log limit) vs O(N log N)
+        # for a full sort when limit is small
+        return heapq.nlargest(
+            limit,
+            self._iter_events(dna),
+            key=lambda e: e.get("timestamp", ""),
+        )
 
+    def _iter_events(
+        self,
+        dna: DNA,
+        event_type: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield timeline event dicts from a DNA snapshot.
+
+        Passing event_type skips constructing the other categories
+        entirely, so typed searches don't pay for the full timeline.
+        """
         # Blueprint design events
-        for name, bp in dna.blueprint.items():
-            events.append({
-                "type": "designed",
-                "organ": name,
-                "description": bp.description[:100] + "..." if len(bp.description) > 100 else bp.description,
-                "timestamp": bp.created_at,
-                "version": bp.version,
-            })
+        if event_type in (None, "designed"):
+            for name, bp in dna.blueprint.items():
+                desc = bp.description
+                yield {
+                    "type": "designed",
+                    "organ": name,
+                    "description": (desc[:97] + "...") if len(desc) > 100 else desc,
+                    "timestamp": bp.created_at,
+                    "version": bp.version,
+                }
 
         # Integration events (approximated from metadata)
-        for name in dna.active_modules:
-            bp = dna.blueprint.get(name)
-            events.append({
-                "type": "integrated",
-                "organ": name,
-                "timestamp": bp.updated_at if bp else dna.metadata.last_modified,
-            })
+        if event_type in (None, "integrated"):
+            for name in dna.active_modules:
+                bp = dna.blueprint.get(name)
+                yield {
+                    "type": "integrated",
+                    "organ": name,
+                    "timestamp": bp.updated_at if bp else dna.metadata.last_modified,
+                }
 
         # Failure events
-        for failure in dna.failures:
-            events.append({
-                "type": "failure",
-                "organ": failure.module_name,
-                "error": failure.error_message[:100],
-                "timestamp": failure.timestamp,
-                "circuit_open": failure.circuit_open,
-            })
-
-        # Sort by timestamp, most recent first
-        events.sort(key=lambda e: e.get("timestamp", ""), reverse=True)
-
-        return events[:limit]
+        if event_type in (None, "failure"):
+            for failure in dna.failures:
+                yield {
+                    "type": "failure",
+                    "organ": failure.module_name,
+                    "error": failure.error_message[:100],
+                    "timestamp": failure.timestamp,
+                    "circuit_open": failure.circuit_open,
+                }
 
     # =========================================
     # Additional Observer Methods
@@ -200,7 +263,7 @@ class Observer(LocalObservable):
     def get_blueprint_details(self, organ_name: str) -> Optional[Dict[str, Any]]:
         """Get detailed blueprint for a specific organ."""
         try:
-            dna = self._repo.load()
+            dna = self._load_dna_cached()
             bp = dna.blueprint.get(organ_name)
             if bp:
                 return {
@@ -255,7 +318,7 @@ class Observer(LocalObservable):
 
                 return {
                     "name": organ.name,
-                    "health": organ.health.value,
+                    "health": organ.health,  # str-Enum: the member is its value
                     "active": organ.active,
                     "failure_count": organ.failure_count,
                     "last_error": organ.last_error,
@@ -279,29 +342,39 @@ class Observer(LocalObservable):
             limit: Max results
         """
         import fnmatch
+        import re
 
-        timeline = self.get_timeline(limit=200)  # Get more, then filter
-
-        results = []
-        for event in timeline:
-            # Filter by type
-            if event_type and event.get("type") != event_type:
-                continue
-
-            # Filter by organ
-            if organ and not fnmatch.fnmatch(event.get("organ", ""), organ):
-                continue
-
-            results.append(event)
-
-            if len(results) >= limit:
-                break
-
-        return results
-
+        try:
+            dna = self._load_dna_cached()
+        except Exception:
+            return []
 
-# Convenience: Module-level singleton
-_observer: Optional[Observer] = None
+        # Filter lazily over the event generator - typed queries never
+        # construct the other categories, and no intermediate 200-element
+        # timeline list is built
+        events = self._iter_events(dna, event_type=event_type)
+
+        if organ:
+            if "*" not in organ and "?" not in organ and "[" not in organ:
+                # Plain name: string equality beats any pattern machinery
+                events = (e for e in events if e.get("organ", "") == organ)
+            else:
+                # Compile once instead of fnmatch.fnmatch re-translating
+                # per event (its internal cache is small and shared)
+                organ_re = re.compile(fnmatch.translate(organ))
+                events = (
+                    e for e in events
+                    if organ_re.match(e.get("organ", ""))
+                )
+
+        return heapq.nlargest(limit, events, key=lambda e: e.get("timestamp", ""))
+
+
+# Convenience: Module-level cached access, keyed by arguments.
+# The old single-slot singleton silently handed callers whatever
+# dna_path the *first* caller used; keying on the args fixes that and
+# keeps the hot path to one dict lookup.
+_observers: Dict[tuple, Observer] = {}
 _observer_lock = threading.Lock()
 
 
@@ -309,13 +382,16 @@ def get_observer(
     dna_path: Union[Path, str] = "dna.json",
     start_time: Optional[float] = None,
 ) -> Observer:
-    """Get or create the observer singleton (thread-safe)."""
-    global _observer
-    if _observer is None:
+    """Get or create the observer for these arguments (thread-safe)."""
+    key = (str(dna_path), start_time)
+    observer = _observers.get(key)
+    if observer is None:
         with _observer_lock:
-            if _observer is None:  # Double-check locking
-                _observer = Observer(dna_path, start_time)
-    return _observer
+            observer = _observers.get(key)
+            if observer is None:  # Double-check locking
+                observer = Observer(dna_path, start_time)
+                _observers[key] = observer
+    return observer
 
 
 def stream_events(patterns: Optional[List[str]] = None) -> Iterator[Event]:
@@ -12,7 +12,7 @@ Protocols are the UNIVERSAL CONTRACT - they work whether
 you're querying locally or across a mesh network.
 """
 
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from typing import List, Dict, Any, Optional, Iterator, Protocol, runtime_checkable
 from enum import Enum
 
@@ -25,7 +25,7 @@ class OrganHealth(str, Enum):
     STOPPED = "stopped"           # Not running
 
 
-@dataclass
+@dataclass(slots=True)
 class OrganInfo:
     """
     Information about a single organ.
@@ -42,7 +42,9 @@ class OrganInfo:
     def to_dict(self) -> Dict[str, Any]:
         return {
             "name": self.name,
-            "health": self.health.value,
+            # OrganHealth subclasses str, so the member IS its value -
+            # no .value descriptor hop needed
+            "health": self.health,
             "active": self.active,
             "failure_count": self.failure_count,
             "last_error": self.last_error,
@@ -50,7 +52,7 @@ class OrganInfo:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class GoalInfo:
     """
     Information about a goal.
@@ -73,7 +75,7 @@ class GoalInfo:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class FailureInfo:
     """
     Information about a failure.
@@ -88,10 +90,17 @@ class FailureInfo:
     timestamp: str
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            "module": self.module,
+            "error_type": self.error_type,
+            "message": self.message,
+            "attempts": self.attempts,
+            "circuit_open": self.circuit_open,
+            "timestamp": self.timestamp,
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class Vitals:
     """
     Essential health metrics for an instance.
@@ -115,7 +124,53 @@ class Vitals:
     last_evolution: Optional[str]  # ISO timestamp
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        # Flat dataclass - a dict literal skips asdict()'s recursive walk
+        return {
+            "instance_id": self.instance_id,
+            "instance_name": self.instance_name,
+            "alive": self.alive,
+            "uptime_seconds": self.uptime_seconds,
+            "dna_hash": self.dna_hash,
+            "organ_count": self.organ_count,
+            "healthy_organs": self.healthy_organs,
+            "sick_organs": self.sick_organs,
+            "pending_blueprints": self.pending_blueprints,
+            "goals_satisfied": self.goals_satisfied,
+            "goals_total": self.goals_total,
+            "total_evolutions": self.total_evolutions,
+            "total_failures": self.total_failures,
+            "last_evolution": self.last_evolution,
+        }
+
+    def to_wire(self) -> tuple:
+        """
+        Positional wire form for mesh RPC.
+
+        A tuple avoids the per-field key strings of to_dict() and is the
+        shape JSON encoders (stdlib or orjson via default=) serialize
+        fastest. Decode with Vitals.from_wire().
+        """
+        return (
+            self.instance_id,
+            self.instance_name,
+            self.alive,
+            self.uptime_seconds,
+            self.dna_hash,
+            self.organ_count,
+            self.healthy_organs,
+            self.sick_organs,
+            self.pending_blueprints,
+            self.goals_satisfied,
+            self.goals_total,
+            self.total_evolutions,
+            self.total_failures,
+            self.last_evolution,
+        )
+
+    @classmethod
+    def from_wire(cls, wire: tuple) -> "Vitals":
+        """Reconstruct from the positional form produced by to_wire()."""
+        return cls(*wire)
 
     @property
     def health_ratio(self) -> float:
@@ -132,6 +187,18 @@ class Vitals:
         return self.goals_satisfied / self.goals_total
 
 
+def wire_default(obj: Any) -> Any:
+    """
+    default= hook for JSON encoders serializing mesh payloads.
+
+    Lets callers pass Vitals instances straight to json.dumps (or
+    orjson.dumps, if installed) without an intermediate to_dict() dict.
+    """
+    if isinstance(obj, Vitals):
+        return obj.to_wire()
+    raise TypeError(f"Object of type {type(obj).__name__} is not wire-serializable")
+
+
 @runtime_checkable
 class Observable(Protocol):
     """
@@ -194,7 +261,7 @@ class LocalObservable(Observable, Protocol):
         ...
 
 
-@dataclass
+@dataclass(slots=True)
 class MeshNodeInfo:
     """
     Information about a node in the mesh.
@@ -137,6 +137,18 @@ class TestEventBus:
         assert bus.get_subscriber_count("count.c") == 0
         assert bus.get_subscriber_count() == 3  # Total
 
+    def test_has_subscribers(self, reset_event_bus):
+        """Test the cheap has_subscribers check."""
+        bus = EventBus()
+
+        assert not bus.has_subscribers("lazy.event")
+
+        handle = bus.subscribe("lazy.event", lambda e: None)
+        assert bus.has_subscribers("lazy.event")
+
+        handle.unsubscribe()
+        assert not bus.has_subscribers("lazy.event")
+
 
 class TestAsyncEventBus:
     """Tests for async event processing."""
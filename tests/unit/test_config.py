@@ -0,0 +1,64 @@
+"""
+Unit tests for Configuration
+"""
+
+import seaa
+from seaa.core.config import SEAAConfig
+
+
+class TestPublicAPI:
+    """Tests for the top-level config bindings."""
+
+    def test_seaa_config_is_instance(self):
+        """seaa.config must be the SEAAConfig instance, not a module."""
+        assert isinstance(seaa.config, SEAAConfig)
+        # Sections are reachable - this is what dashboards/CLI rely on
+        assert seaa.config.llm.model
+
+    def test_core_config_is_instance(self):
+        """seaa.core.config (the __init__ re-export) is the instance too."""
+        from seaa.core import config as core_config
+        assert isinstance(core_config, SEAAConfig)
+
+
+def _header_block(exclude=()):
+    """All consumed top-level keys as minimal YAML, minus `exclude`."""
+    lines = []
+    for name in sorted(SEAAConfig._HEADER_KEYS - set(exclude)):
+        if name == "version":
+            lines.append('version: "9.9"')
+        elif name == "environment":
+            lines.append("environment: production")
+        elif name == "durable_writes":
+            lines.append("durable_writes: true")
+        else:
+            lines.append(f"{name}: {{}}")
+    return "\n".join(lines)
+
+
+_FILLER = "filler:\n" + "\n".join(f"  - padding-entry-{i:05d}" for i in range(4000))
+
+
+class TestTruncatedHeaderParse:
+    """Tests for the bounded-prefix parse of oversized config files."""
+
+    def test_trailing_section_forces_full_parse(self, tmp_path):
+        """A consumed section after the 8 KiB cut must not revert to defaults."""
+        text = f"{_header_block(exclude=('api',))}\n{_FILLER}\napi:\n  port: 9999\n"
+        assert len(text) > 32_768
+        path = tmp_path / "config.yaml"
+        path.write_text(text)
+
+        data = SEAAConfig._parse_yaml(path)
+        assert SEAAConfig.from_dict(data).api.port == 9999
+
+    def test_header_parse_accepted_when_sections_lead(self, tmp_path):
+        """With every consumed key up front, the truncated parse is trusted."""
+        text = f"{_header_block()}\n{_FILLER}\n"
+        path = tmp_path / "config.yaml"
+        path.write_text(text)
+
+        data = SEAAConfig._parse_yaml(path)
+        # Proof the 8 KiB prefix was used: the filler list was cut short
+        assert 0 < len(data["filler"]) < 4000
+        assert SEAAConfig.from_dict(data).environment == "production"
@@ -0,0 +1,72 @@
+"""
+Unit tests for the LLM response cache
+"""
+
+from seaa.connectors.llm_gateway import LLMCache
+
+
+def _make_cache(tmp_path) -> LLMCache:
+    return LLMCache(tmp_path / "cache.db")
+
+
+def _store(cache: LLMCache, prompt: str, response: str) -> str:
+    key = LLMCache.make_key("ollama", "test-model", 0.0, prompt)
+    cache.store(key, response, "ollama", "test-model", 0.0, prompt)
+    return key
+
+
+BASE_PROMPT = (
+    "Analyze the current system state and decide whether evolution "
+    "is required given the goals blueprint and recent failure records "
+    "listed below then answer with a single json object"
+)
+
+
+class TestExactLookup:
+    """Tests for keyed lookups."""
+
+    def test_roundtrip(self, tmp_path):
+        cache = _make_cache(tmp_path)
+        key = _store(cache, BASE_PROMPT, "the answer")
+        assert cache.lookup(key) == "the answer"
+
+    def test_miss(self, tmp_path):
+        cache = _make_cache(tmp_path)
+        assert cache.lookup("no-such-key") is None
+
+
+class TestFuzzyLookup:
+    """Tests for similarity-matched lookups."""
+
+    def test_cosmetic_variant_hits(self, tmp_path):
+        """A prompt differing by one token sits above the threshold."""
+        cache = _make_cache(tmp_path)
+        _store(cache, BASE_PROMPT, "cached response")
+
+        variant = BASE_PROMPT.replace("recent", "latest")
+        assert cache.fuzzy_lookup("ollama", "test-model", 0.0, variant) == "cached response"
+
+    def test_unrelated_prompt_misses(self, tmp_path):
+        """A substantially different prompt stays below the threshold."""
+        cache = _make_cache(tmp_path)
+        _store(cache, BASE_PROMPT, "cached response")
+
+        other = "Summarize yesterday's organ integration log in two lines"
+        assert cache.fuzzy_lookup("ollama", "test-model", 0.0, other) is None
+
+    def test_provider_config_must_match(self, tmp_path):
+        """Fuzzy hits never cross provider/model/temperature boundaries."""
+        cache = _make_cache(tmp_path)
+        _store(cache, BASE_PROMPT, "cached response")
+
+        assert cache.fuzzy_lookup("gemini", "test-model", 0.0, BASE_PROMPT) is None
+        assert cache.fuzzy_lookup("ollama", "other-model", 0.0, BASE_PROMPT) is None
+
+    def test_delete_removes_entry(self, tmp_path):
+        """delete() evicts both the exact and the fuzzy path."""
+        cache = _make_cache(tmp_path)
+        key = _store(cache, BASE_PROMPT, "cached response")
+
+        cache.delete(key)
+        assert cache.lookup(key) is None
+        assert cache.fuzzy_lookup("ollama", "test-model", 0.0, BASE_PROMPT) is None
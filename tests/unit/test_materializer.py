@@ -4,7 +4,7 @@ Unit tests for the Materializer
 
 import pytest
 from pathlib import Path
-from seaa.kernel.materializer import Materializer
+from seaa.kernel.materializer import Materializer, MODULE_NAME_PATTERN
 from seaa.core.exceptions import KernelProtectionError, MaterializationError
 
 
@@ -172,6 +172,11 @@ class TestMaterializerSecurity:
         with pytest.raises(MaterializationError):
             materializer.materialize("soma", sample_organ_code)
 
+    def test_pattern_rejects_consecutive_dots(self):
+        """The name pattern itself forbids empty components like 'soma..x'."""
+        assert MODULE_NAME_PATTERN.match("soma..x") is None
+        assert MODULE_NAME_PATTERN.match("") is None
+
     def test_valid_deep_nesting_accepted(self, temp_dir, sample_organ_code):
         """Test that valid deeply nested modules are accepted."""
         materializer = Materializer(root_dir=temp_dir)
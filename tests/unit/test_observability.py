@@ -39,7 +39,7 @@ class TestIdentity:
         identity = manager.get_identity()
 
         assert identity is not None
-        assert len(identity.id) == 36  # UUID format
+        assert len(identity.id) == 32  # UUID hex format (no hyphens)
         assert identity.name.startswith("SEAA-")
         assert identity.genesis_time is not None
         assert identity_path.exists()
@@ -164,13 +164,9 @@ class TestBeacon:
 
         # Reset identity manager to use temp path
         IdentityManager.reset_instance()
-        from seaa.kernel import identity as identity_module
-        identity_module._manager = None
 
-        with patch.object(IdentityManager, '__new__', return_value=IdentityManager.__new__(IdentityManager)):
-            IdentityManager.reset_instance()
-            beacon = Beacon(dna_path)
-            vitals = beacon.get_vitals()
+        beacon = Beacon(dna_path)
+        vitals = beacon.get_vitals()
 
         assert vitals.alive is True
         assert vitals.organ_count == 0  # No active modules in sample
@@ -358,7 +354,7 @@ class TestThreadSafety:
 
         def get_identity_thread():
             try:
-                manager = IdentityManager(identity_path, dna_path)
+                manager = get_identity_manager(identity_path, dna_path)
                 identity = manager.get_identity()
                 identities.append(identity.id)
             except Exception as e: